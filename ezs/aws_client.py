@@ -1,12 +1,43 @@
 """AWS API client wrappers"""
 
+import copy
+import threading
+import time
 import boto3
+from botocore.config import Config
 from typing import List, Dict, Optional
 from rich.console import Console
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from .config import ECS_AGENT_CONTAINER_NAME_LOWER
 
 console = Console()
 
+# Shared pool for short, independent AWS calls (per-region listing, batched
+# describe calls). Threads are started on demand and reused across calls.
+# Work submitted here must not itself wait on _POOL, or it can deadlock.
+_POOL = ThreadPoolExecutor(max_workers=20, thread_name_prefix="ezs-aws")
+# On exit, drop queued calls (e.g. a background prefetch) so only in-flight ones
+# are waited for. concurrent.futures joins its workers from a threading exit
+# hook that runs before atexit, so this has to be one too; later hooks run first.
+threading._register_atexit(lambda: _POOL.shutdown(wait=False, cancel_futures=True))
+
+# Shared client config: the default pool of 10 connections is smaller than
+# _POOL, so concurrent describe calls would queue for a connection.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True,
+)
+
+# SSM reachability cache: (profile, region, instance_id) -> (checked_at, reachable)
+SSM_CACHE_TTL = 60
+_ssm_access_cache: Dict[tuple, tuple] = {}
+
+# Task definition revisions are immutable: (profile, region, arn) -> taskDefinition
+_task_def_cache: Dict[tuple, Dict] = {}
+
 
 class AWSClient:
     def __init__(self, region: str, profile: Optional[str] = None):
@@ -18,10 +49,10 @@ class AWSClient:
     def _init_clients(self, region: str):
         """Initialize boto3 clients for a specific region"""
         session = boto3.Session(region_name=region, profile_name=self.profile)
-        self.ecs = session.client('ecs')
-        self.ec2 = session.client('ec2')
-        self.ssm = session.client('ssm')
-        self.logs = session.client('logs')
+        self.ecs = session.client('ecs', config=_CLIENT_CONFIG)
+        self.ec2 = session.client('ec2', config=_CLIENT_CONFIG)
+        self.ssm = session.client('ssm', config=_CLIENT_CONFIG)
+        self.logs = session.client('logs', config=_CLIENT_CONFIG)
         self.region = region
 
     def set_region(self, region: str):
@@ -38,19 +69,20 @@ class AWSClient:
             return []
 
     @staticmethod
-    def list_all_clusters(regions: dict, profile: Optional[str] = None) -> List[Dict]:
+    def list_all_clusters(regions: dict, profile: Optional[str] = None,
+                          failed: Optional[set] = None) -> List[Dict]:
         """List all ECS clusters from all regions (parallel), preserving region order.
-        Legacy single-account method.
+        Legacy single-account method. Regions whose listing fails are added to
+        `failed` as (profile, region) when given.
         """
         region_order = list(regions.keys())
         results_by_region = {code: [] for code in region_order}
+        clients = _ecs_clients({(profile, code) for code in region_order})
 
         def fetch_region(region_code: str, region_name: str):
             """Fetch clusters from a single region"""
             try:
-                session = boto3.Session(region_name=region_code, profile_name=profile)
-                ecs = session.client('ecs')
-                response = ecs.list_clusters()
+                response = clients[(profile, region_code)].list_clusters()
                 return region_code, [
                     {
                         'arn': arn,
@@ -61,17 +93,18 @@ class AWSClient:
                     for arn in response.get('clusterArns', [])
                 ]
             except Exception:
+                if failed is not None:
+                    failed.add((profile, region_code))
                 return region_code, []
 
         # Fetch all regions in parallel
-        with ThreadPoolExecutor(max_workers=len(regions)) as executor:
-            futures = [
-                executor.submit(fetch_region, code, name)
-                for code, name in regions.items()
-            ]
-            for future in as_completed(futures):
-                region_code, clusters = future.result()
-                results_by_region[region_code] = sorted(clusters, key=lambda x: x['name'])
+        futures = [
+            _POOL.submit(fetch_region, code, name)
+            for code, name in regions.items()
+        ]
+        for future in as_completed(futures):
+            region_code, clusters = future.result()
+            results_by_region[region_code] = sorted(clusters, key=lambda x: x['name'])
 
         # Flatten in region order
         all_clusters = []
@@ -81,11 +114,12 @@ class AWSClient:
         return all_clusters
 
     @staticmethod
-    def list_all_clusters_multi(accounts: List[Dict]) -> List[Dict]:
+    def list_all_clusters_multi(accounts: List[Dict], failed: Optional[set] = None) -> List[Dict]:
         """List ECS clusters from multiple accounts/profiles in parallel.
 
         Args:
             accounts: list of {"profile": str|None, "name": str, "regions": [str]}
+            failed: optional set that collects (profile, region) pairs whose listing failed
 
         Returns:
             list of cluster dicts with 'account_name' and 'profile' fields added.
@@ -107,27 +141,28 @@ class AWSClient:
         if not fetch_jobs:
             return []
 
+        clients = _ecs_clients({(job[0], job[2]) for job in fetch_jobs})
+
         def fetch_clusters(job):
             profile, account_name, region_code, region_name = job
             try:
-                session = boto3.Session(region_name=region_code, profile_name=profile)
-                ecs = session.client('ecs')
-                response = ecs.list_clusters()
+                response = clients[(profile, region_code)].list_clusters()
                 return [(profile, account_name, region_code, region_name, arn)
                         for arn in response.get('clusterArns', [])]
             except Exception:
+                if failed is not None:
+                    failed.add((profile, region_code))
                 return []
 
         # Parallel fetch across all account+region combinations
         results_by_job = {}
-        with ThreadPoolExecutor(max_workers=min(len(fetch_jobs), 20)) as executor:
-            futures = {executor.submit(fetch_clusters, job): job for job in fetch_jobs}
-            for future in as_completed(futures):
-                job = futures[future]
-                try:
-                    results_by_job[job] = future.result()
-                except Exception:
-                    results_by_job[job] = []
+        futures = {_POOL.submit(fetch_clusters, job): job for job in fetch_jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                results_by_job[job] = future.result()
+            except Exception:
+                results_by_job[job] = []
 
         # Flatten preserving account > region order
         for job in fetch_jobs:
@@ -153,21 +188,20 @@ class AWSClient:
             paginator = self.ecs.get_paginator('list_services')
             pages = paginator.paginate(cluster=cluster)
 
-            service_arns = []
-            for page in pages:
-                service_arns.extend(page.get('serviceArns', []))
-
-            if not service_name:
-                service_arns.sort(key=extract_name_from_arn)
-                return service_arns
+            service_arns = chain.from_iterable(page.get('serviceArns', ()) for page in pages)
 
-            filtered_arns = [
-                arn for arn in service_arns
-                if service_name.lower() in extract_name_from_arn(arn).lower()
-            ]
+            # Parse each ARN once; (name, arn) tuples sort by name without a key function
+            if service_name:
+                needle = service_name.lower()
+                named = [
+                    (name, arn) for arn in service_arns
+                    if needle in (name := extract_name_from_arn(arn)).lower()
+                ]
+            else:
+                named = [(extract_name_from_arn(arn), arn) for arn in service_arns]
 
-            filtered_arns.sort(key=extract_name_from_arn)
-            return filtered_arns
+            named.sort()
+            return [arn for _, arn in named]
 
         except Exception as e:
             console.print(f"[red]Error listing services: {e}[/red]")
@@ -176,42 +210,53 @@ class AWSClient:
     def list_tasks(self, cluster: str, service: str) -> List[Dict]:
         """List running tasks for service with details"""
         try:
-            # Get task ARNs
-            response = self.ecs.list_tasks(
-                cluster=cluster,
-                serviceName=service,
-                desiredStatus='RUNNING'
-            )
-            task_arns = response.get('taskArns', [])
-            
+            task_arns = self._list_task_arns(cluster, service)
+
             if not task_arns:
                 console.print("[yellow]Warning: No RUNNING tasks found for this service[/yellow]")
                 return []
-            
-            # Get task details
-            tasks_response = self.ecs.describe_tasks(
-                cluster=cluster,
-                tasks=task_arns
-            )
-            
-            tasks = tasks_response.get('tasks', [])
-            
-            # Filter only RUNNING tasks and warn about others
-            running_tasks = []
-            for task in tasks:
-                if task['lastStatus'] == 'RUNNING':
-                    running_tasks.append(task)
-                else:
-                    console.print(f"[yellow]Warning: Skipping task {task['taskArn'].split('/')[-1]} (status: {task['lastStatus']})[/yellow]")
-            
-            return running_tasks
-            
+
+            return self._describe_running_tasks(cluster, task_arns)
+
         except Exception as e:
             console.print(f"[red]Error listing tasks: {e}[/red]")
             return []
 
+    def _list_task_arns(self, cluster: str, service: str) -> List[str]:
+        """ARNs of a service's running tasks (paginated, 100 per page)"""
+        paginator = self.ecs.get_paginator('list_tasks')
+        pages = paginator.paginate(
+            cluster=cluster,
+            serviceName=service,
+            desiredStatus='RUNNING'
+        )
+        return list(chain.from_iterable(page.get('taskArns', ()) for page in pages))
+
+    def _describe_running_tasks(self, cluster: str, task_arns: List[str]) -> List[Dict]:
+        """Describe tasks, keeping only those still RUNNING"""
+        # DescribeTasks accepts up to 100 tasks per call
+        responses = _map_batches(
+            lambda batch: self.ecs.describe_tasks(cluster=cluster, tasks=batch),
+            _chunks(task_arns, 100)
+        )
+        tasks = list(chain.from_iterable(r.get('tasks', []) for r in responses))
+
+        # Filter only RUNNING tasks and warn about others
+        running_tasks = []
+        for task in tasks:
+            if task['lastStatus'] == 'RUNNING':
+                running_tasks.append(task)
+            else:
+                console.print(f"[yellow]Warning: Skipping task {task['taskArn'].split('/')[-1]} (status: {task['lastStatus']})[/yellow]")
+
+        return running_tasks
+
     def get_container_instance_id(self, cluster: str, task: Dict) -> Optional[str]:
         """Get EC2 instance ID from task's container instance ARN"""
+        # Tasks from list_tasks are already enriched in one batched call
+        if task.get('_instanceId'):
+            return task['_instanceId']
+
         try:
             container_instance_arn = task.get('containerInstanceArn')
             if not container_instance_arn:
@@ -232,39 +277,65 @@ class AWSClient:
             console.print(f"[red]Error getting instance ID: {e}[/red]")
             return None
 
-    def enrich_tasks_with_instance_info(self, cluster: str, tasks: List[Dict]) -> List[Dict]:
-        """Add instance ID and IP to each task"""
+    def enrich_tasks_with_instance_info(self, cluster: str, tasks: List[Dict],
+                                        check_ssm: bool = False) -> List[Dict]:
+        """Add instance ID and IP to each task.
+
+        With check_ssm, SSM access for the instances is verified while the
+        EC2 lookup is in flight, so later verify_ssm_access calls hit the cache.
+        """
         if not tasks:
             return tasks
 
         try:
-            # Get unique container instance ARNs
-            container_arns = list(set(
-                t.get('containerInstanceArn') for t in tasks
-                if t.get('containerInstanceArn')
+            # Get unique container instance ARNs (dict keeps first-seen task order)
+            container_arns = list(dict.fromkeys(
+                arn for t in tasks
+                if (arn := t.get('containerInstanceArn'))
             ))
 
             if not container_arns:
                 return tasks
 
-            # Describe container instances
-            response = self.ecs.describe_container_instances(
-                cluster=cluster,
-                containerInstances=container_arns
+            # Describe container instances (up to 100 per call, batches in parallel)
+            responses = _map_batches(
+                lambda batch: self.ecs.describe_container_instances(
+                    cluster=cluster,
+                    containerInstances=batch
+                ),
+                _chunks(container_arns, 100)
             )
 
             # Map ARN to instance ID
             arn_to_instance = {}
-            instance_ids = []
-            for ci in response.get('containerInstances', []):
-                arn_to_instance[ci['containerInstanceArn']] = ci.get('ec2InstanceId')
-                if ci.get('ec2InstanceId'):
-                    instance_ids.append(ci['ec2InstanceId'])
+            for response in responses:
+                for ci in response.get('containerInstances', []):
+                    arn_to_instance[ci['containerInstanceArn']] = ci.get('ec2InstanceId')
+
+            # awsvpc tasks already carry their IP on the ENI attachment, so only
+            # look up instances for tasks without one
+            task_ips = {id(t): ip for t in tasks if (ip := _eni_private_ip(t))}
+            instance_ids = list(dict.fromkeys(
+                instance_id for t in tasks
+                if id(t) not in task_ips
+                and (instance_id := arn_to_instance.get(t.get('containerInstanceArn')))
+            ))
+
+            # Get EC2 instance IPs (up to 1000 instance IDs per call). Only the
+            # leaf calls go to the pool; the SSM check runs on this thread.
+            ec2_futures = [
+                _POOL.submit(
+                    self.ec2.describe_instances,
+                    InstanceIds=batch,
+                    Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
+                )
+                for batch in _chunks(instance_ids, 1000)
+            ]
+            if check_ssm:
+                self.verify_ssm_access_many([i for i in arn_to_instance.values() if i])
 
-            # Get EC2 instance IPs
             instance_to_ip = {}
-            if instance_ids:
-                ec2_response = self.ec2.describe_instances(InstanceIds=instance_ids)
+            for ec2_response in (f.result() for f in ec2_futures):
                 for reservation in ec2_response.get('Reservations', []):
                     for instance in reservation.get('Instances', []):
                         instance_id = instance['InstanceId']
@@ -276,7 +347,7 @@ class AWSClient:
                 arn = task.get('containerInstanceArn')
                 instance_id = arn_to_instance.get(arn, '')
                 task['_instanceId'] = instance_id
-                task['_instanceIp'] = instance_to_ip.get(instance_id, '')
+                task['_instanceIp'] = task_ips.get(id(task)) or instance_to_ip.get(instance_id, '')
 
             return tasks
 
@@ -286,33 +357,68 @@ class AWSClient:
 
     def get_task_containers(self, task: Dict, exclude_agent: bool = True) -> List[Dict]:
         """Get containers from task, optionally excluding ECS agent"""
-        from .config import ECS_AGENT_CONTAINER_NAME
-        
         containers = task.get('containers', [])
-        
+
         if exclude_agent:
+            needle = ECS_AGENT_CONTAINER_NAME_LOWER
             containers = [
-                c for c in containers 
-                if ECS_AGENT_CONTAINER_NAME not in c.get('name', '').lower()
+                c for c in containers
+                if needle not in c.get('name', '').lower()
             ]
-        
+
         return containers
 
     def verify_ssm_access(self, instance_id: str) -> bool:
         """Check if instance is accessible via SSM"""
+        return instance_id in self.verify_ssm_access_many([instance_id])
+
+    def verify_ssm_access_many(self, instance_ids: List[str]) -> set:
+        """Return the subset of instance IDs that are accessible via SSM.
+
+        Results are cached per instance for SSM_CACHE_TTL seconds; only
+        uncached IDs are sent to DescribeInstanceInformation, 50 per call.
+        """
+        now = time.monotonic()
+        reachable = set()
+        missing = []
+        for instance_id in dict.fromkeys(instance_ids):
+            cached = _ssm_access_cache.get((self.profile, self.region, instance_id))
+            if cached and now - cached[0] < SSM_CACHE_TTL:
+                if cached[1]:
+                    reachable.add(instance_id)
+            else:
+                missing.append(instance_id)
+
+        if not missing:
+            return reachable
+
+        def describe(batch):
+            paginator = self.ssm.get_paginator('describe_instance_information')
+            pages = paginator.paginate(Filters=[{'Key': 'InstanceIds', 'Values': batch}])
+            return [info['InstanceId'] for page in pages
+                    for info in page.get('InstanceInformationList', [])]
+
         try:
-            response = self.ssm.describe_instance_information(
-                Filters=[
-                    {
-                        'Key': 'InstanceIds',
-                        'Values': [instance_id]
-                    }
-                ]
-            )
-            return len(response.get('InstanceInformationList', [])) > 0
+            found = set(chain.from_iterable(_map_batches(describe, _chunks(missing, 50))))
         except Exception as e:
             console.print(f"[red]Error checking SSM access: {e}[/red]")
-            return False
+            return reachable
+
+        for instance_id in missing:
+            _ssm_access_cache[(self.profile, self.region, instance_id)] = (now, instance_id in found)
+        return reachable | found
+
+    def describe_task_definition(self, task_def_arn: str) -> Dict:
+        """Describe a task definition revision, cached since revisions never change.
+
+        The returned dict is shared; callers must not modify it.
+        """
+        key = (self.profile, self.region, task_def_arn)
+        task_def = _task_def_cache.get(key)
+        if task_def is None:
+            response = self.ecs.describe_task_definition(taskDefinition=task_def_arn)
+            task_def = _task_def_cache[key] = response.get('taskDefinition', {})
+        return task_def
 
     def get_log_group_for_task(self, task: Dict, container_name: str) -> Optional[str]:
         """Get CloudWatch log group for a task's container"""
@@ -323,8 +429,7 @@ class AWSClient:
                 return None
 
             # Describe task definition
-            response = self.ecs.describe_task_definition(taskDefinition=task_def_arn)
-            task_def = response.get('taskDefinition', {})
+            task_def = self.describe_task_definition(task_def_arn)
 
             # Find container definition
             for container_def in task_def.get('containerDefinitions', []):
@@ -349,8 +454,7 @@ class AWSClient:
             if not task_def_arn or not task_id:
                 return None
 
-            response = self.ecs.describe_task_definition(taskDefinition=task_def_arn)
-            task_def = response.get('taskDefinition', {})
+            task_def = self.describe_task_definition(task_def_arn)
 
             for container_def in task_def.get('containerDefinitions', []):
                 if container_def.get('name') == container_name:
@@ -378,8 +482,7 @@ class AWSClient:
             if not task_def_arn or not task_id:
                 return []
 
-            response = self.ecs.describe_task_definition(taskDefinition=task_def_arn)
-            task_def = response.get('taskDefinition', {})
+            task_def = self.describe_task_definition(task_def_arn)
 
             for container_def in task_def.get('containerDefinitions', []):
                 name = container_def.get('name')
@@ -420,8 +523,7 @@ class AWSClient:
             if not task_def_arn:
                 return {}
 
-            response = self.ecs.describe_task_definition(taskDefinition=task_def_arn)
-            task_def = response.get('taskDefinition', {})
+            task_def = self.describe_task_definition(task_def_arn)
 
             for container_def in task_def.get('containerDefinitions', []):
                 if container_def.get('name') == container_name:
@@ -487,15 +589,17 @@ class AWSClient:
     def _fetch_ssm_parameters(self, param_paths: List[str]) -> Dict[str, tuple]:
         """Fetch SSM parameters and return dict of path -> (value, type)"""
         result = {}
+
+        def fetch_batch(batch):
+            return self.ssm.get_parameters(
+                Names=batch,
+                WithDecryption=True
+            ).get('Parameters', [])
+
         try:
-            # SSM GetParameters can fetch up to 10 at a time
-            for i in range(0, len(param_paths), 10):
-                batch = param_paths[i:i+10]
-                response = self.ssm.get_parameters(
-                    Names=batch,
-                    WithDecryption=True
-                )
-                for param in response.get('Parameters', []):
+            # SSM GetParameters can fetch up to 10 at a time, batches run in parallel
+            for params in _map_batches(fetch_batch, _chunks(param_paths, 10)):
+                for param in params:
                     name = param.get('Name', '')
                     value = param.get('Value', '')
                     param_type = param.get('Type', 'String')
@@ -509,9 +613,10 @@ class AWSClient:
         result = {}
         try:
             session = boto3.Session(region_name=self.region, profile_name=self.profile)
-            sm = session.client('secretsmanager')
+            sm = session.client('secretsmanager', config=_CLIENT_CONFIG)
 
-            for env_name, secret_arn in secrets:
+            def fetch_secret(secret):
+                env_name, secret_arn = secret
                 try:
                     # Handle ARN with optional JSON key suffix
                     # Format: arn:aws:secretsmanager:region:account:secret:name-suffix:json_key:version
@@ -540,9 +645,13 @@ class AWSClient:
                         except (json.JSONDecodeError, TypeError):
                             pass
 
-                    result[env_name] = f'[SECRET]{secret_value}'
+                    return env_name, f'[SECRET]{secret_value}'
                 except Exception as e:
-                    result[env_name] = f'[ERROR] Could not fetch: {str(e)[:30]}'
+                    return env_name, f'[ERROR] Could not fetch: {str(e)[:30]}'
+
+            # Secrets are independent - fetch them in parallel
+            for env_name, value in _POOL.map(fetch_secret, secrets):
+                result[env_name] = value
         except Exception as e:
             console.print(f"[yellow]Warning: Could not fetch Secrets Manager secrets: {e}[/yellow]")
         return result
@@ -558,8 +667,7 @@ class AWSClient:
             if not task_def_arn:
                 return {}
 
-            response = self.ecs.describe_task_definition(taskDefinition=task_def_arn)
-            task_def = response.get('taskDefinition', {})
+            task_def = self.describe_task_definition(task_def_arn)
 
             result = {}
             for container_def in task_def.get('containerDefinitions', []):
@@ -580,8 +688,8 @@ class AWSClient:
         """
         try:
             # 1. Fetch original definition
-            response = self.ecs.describe_task_definition(taskDefinition=original_task_def_arn)
-            task_def = response.get('taskDefinition', {})
+            # Copy, since the cached definition must not be modified
+            task_def = copy.deepcopy(self.describe_task_definition(original_task_def_arn))
 
             # 2. Clean up read-only fields
             fields_to_remove = [
@@ -638,24 +746,43 @@ class AWSClient:
         if progress_callback:
             progress_callback(f"Found {len(services)} services, fetching tasks...")
 
-        # 2. Fetch tasks for all services in parallel
-        def fetch_service_tasks(service_arn):
-            tasks = self.list_tasks(cluster_arn, service_arn)
-            if tasks and len(tasks) > 1:
-                tasks = self.enrich_tasks_with_instance_info(cluster_arn, tasks)
-            elif tasks and len(tasks) == 1:
-                # Still enrich single task
-                tasks = self.enrich_tasks_with_instance_info(cluster_arn, tasks)
-            return service_arn, tasks
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(fetch_service_tasks, svc) for svc in services]
-            for future in as_completed(futures):
-                try:
-                    service_arn, tasks = future.result()
-                    result['tasks'][service_arn] = tasks if tasks else []
-                except Exception:
-                    pass
+        # 2. List task ARNs for all services in parallel on the shared pool,
+        # then describe them in 100-task batches shared across services.
+        # Enriching fans out on the pool itself, so that runs here.
+        def list_service_task_arns(service_arn):
+            try:
+                return self._list_task_arns(cluster_arn, service_arn)
+            except Exception:
+                return None
+
+        task_service = {}  # task ARN -> service ARN
+        for service_arn, task_arns in zip(services, _POOL.map(list_service_task_arns, services)):
+            # Services that failed to list are left out and fetched on demand
+            if task_arns is not None:
+                result['tasks'][service_arn] = []
+                task_service.update(dict.fromkeys(task_arns, service_arn))
+
+        def describe_batch(task_arns):
+            # A single batch is described inline, without waiting on the pool
+            try:
+                return self._describe_running_tasks(cluster_arn, task_arns)
+            except Exception:
+                return None
+
+        batches = _chunks(list(task_service), 100)
+        tasks = []
+        for batch, batch_tasks in zip(batches, _map_batches(describe_batch, batches)):
+            if batch_tasks is None:
+                # Drop only the services with tasks in the failed batch
+                for task_arn in batch:
+                    result['tasks'].pop(task_service[task_arn], None)
+            else:
+                tasks.extend(batch_tasks)
+
+        for task in self.enrich_tasks_with_instance_info(cluster_arn, tasks):
+            service_arn = task_service[task['taskArn']]
+            if service_arn in result['tasks']:
+                result['tasks'][service_arn].append(task)
 
         # Count total tasks
         total_tasks = sum(len(t) for t in result['tasks'].values())
@@ -668,19 +795,21 @@ class AWSClient:
             for task in tasks:
                 all_tasks.append(task)
 
-        if all_tasks:
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {
-                    executor.submit(self._fetch_task_containers, cluster_arn, task): task['taskArn']
-                    for task in all_tasks
-                }
-                for future in as_completed(futures):
-                    task_arn = futures[future]
-                    try:
-                        instance_id, containers = future.result()
-                        result['containers'][task_arn] = (instance_id, containers)
-                    except Exception:
-                        result['containers'][task_arn] = (None, [])
+        # Check SSM access for all known instances in one batch so the
+        # per-task checks below are cache hits
+        instance_ids = [t['_instanceId'] for t in all_tasks if t.get('_instanceId')]
+        if instance_ids:
+            self.verify_ssm_access_many(instance_ids)
+
+        # With instance IDs enriched and SSM access cached, these are leaf calls
+        def fetch_task_containers(task):
+            try:
+                return self._fetch_task_containers(cluster_arn, task)
+            except Exception:
+                return (None, [])
+
+        for task, entry in zip(all_tasks, _POOL.map(fetch_task_containers, all_tasks)):
+            result['containers'][task['taskArn']] = entry
 
         if progress_callback:
             progress_callback("Done!")
@@ -732,7 +861,7 @@ class AWSClient:
         """Update Secrets Manager secret value. Returns the secret ARN."""
         try:
             session = boto3.Session(region_name=self.region, profile_name=self.profile)
-            sm = session.client('secretsmanager')
+            sm = session.client('secretsmanager', config=_CLIENT_CONFIG)
 
             if json_key:
                 # Need to update just one key in the JSON
@@ -755,8 +884,7 @@ class AWSClient:
             if not task_def_arn:
                 return {}
 
-            response = self.ecs.describe_task_definition(taskDefinition=task_def_arn)
-            task_def = response.get('taskDefinition', {})
+            task_def = self.describe_task_definition(task_def_arn)
 
             secrets_map = {}
             for container_def in task_def.get('containerDefinitions', []):
@@ -821,9 +949,35 @@ class AWSClient:
             console.print(f"[red]Error getting log events: {e}[/red]")
             return []
 
+    def iter_log_events(self, log_group: str, log_stream: str,
+                        start_time: Optional[int] = None,
+                        end_time: Optional[int] = None):
+        """Generator that yields all log events in a time range, oldest first, a page at a time.
+
+        API errors propagate, so callers can tell a partial range from a complete one.
+        """
+        kwargs = {
+            'logGroupName': log_group,
+            'logStreamName': log_stream,
+            'startFromHead': True,
+            'limit': 10000,  # API maximum; pages are also capped at 1 MB
+        }
+        if start_time:
+            kwargs['startTime'] = start_time
+        if end_time:
+            kwargs['endTime'] = end_time
+
+        while True:
+            response = self.logs.get_log_events(**kwargs)
+            yield from response.get('events', [])
+            # The forward token stops changing once the range is exhausted
+            next_token = response.get('nextForwardToken')
+            if not next_token or next_token == kwargs.get('nextToken'):
+                break
+            kwargs['nextToken'] = next_token
+
     def stream_log_events(self, log_group: str, log_stream: str):
         """Generator that yields new log events (for live streaming)"""
-        import time
         next_token = None
 
         while True:
@@ -855,7 +1009,65 @@ class AWSClient:
                 break
 
 
+def _ecs_clients(targets) -> Dict[tuple, object]:
+    """Create ECS clients for (profile, region) pairs, one boto3 Session per profile.
+
+    Sessions are not thread-safe, so clients are built here up front and only
+    the (thread-safe) clients are handed to worker threads. Pairs whose
+    profile or client cannot be created are left out.
+    """
+    sessions = {}
+    clients = {}
+    for profile, region in targets:
+        try:
+            if profile not in sessions:
+                sessions[profile] = boto3.Session(profile_name=profile)
+            clients[(profile, region)] = sessions[profile].client('ecs', region_name=region, config=_CLIENT_CONFIG)
+        except Exception:
+            continue
+    return clients
+
+
+def _chunks(items: List, size: int) -> List[List]:
+    """Split list into batches of at most `size` items (AWS per-call limits)"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def map_in_pool(fn, items: List) -> List:
+    """Call fn for each item in parallel on the shared AWS pool, results in order.
+
+    fn must not itself wait on the pool (see _POOL).
+    """
+    return list(_POOL.map(fn, items))
+
+
+def _map_batches(fn, batches: List[List]) -> List:
+    """Call fn for each batch, in parallel on the shared pool when there is more than one.
+
+    boto3 clients are thread-safe, so batches share the caller's client.
+    """
+    if len(batches) <= 1:
+        return [fn(batch) for batch in batches]
+    return list(_POOL.map(fn, batches))
+
+
+def _eni_private_ip(task: Dict) -> Optional[str]:
+    """Private IPv4 address from the task's ENI attachment, if any"""
+    for attachment in task.get('attachments', []):
+        if attachment.get('type') != 'ElasticNetworkInterface':
+            continue
+        for detail in attachment.get('details', []):
+            if detail.get('name') == 'privateIPv4Address':
+                return detail.get('value')
+    return None
+
+
+@lru_cache(maxsize=4096)
 def extract_name_from_arn(arn: str) -> str:
     """Extract readable name from AWS ARN"""
     # ECS ARNs format: arn:aws:ecs:region:account:cluster/name
-    return arn.split('/')[-1] if '/' in arn else arn.split(':')[-1]
+    # rpartition stops at the last delimiter without building a list
+    _, sep, tail = arn.rpartition('/')
+    if sep:
+        return tail
+    return arn.rpartition(':')[2]
@@ -0,0 +1,106 @@
+"""On-disk cache for AWS listings reused across runs"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CACHE_DIR = Path.home() / ".cache" / "ezs"
+SERVICES_CACHE_FILE = CACHE_DIR / "services.json"
+CLUSTERS_CACHE_FILE = CACHE_DIR / "clusters.json"
+
+# Seconds a cached service list stays valid
+SERVICES_CACHE_TTL = 300
+# Seconds a cached cluster list stays valid
+CLUSTERS_CACHE_TTL = 300
+
+
+def _services_key(profile: Optional[str], cluster_arn: str) -> str:
+    """Cache key for a cluster's services (cluster ARNs already include the region)"""
+    return f"{profile or ''}|{cluster_arn}"
+
+
+def _clusters_key(source: Dict) -> str:
+    """Cache key for the cluster list of a profile/regions or accounts configuration"""
+    return json.dumps(source, sort_keys=True)
+
+
+def _read_cache(path: Path) -> Dict:
+    """Read a cache file, treating a missing or corrupt file as empty"""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return {}
+    try:
+        return orjson.loads(data) if orjson else json.loads(data)
+    except ValueError:
+        return {}
+
+
+def _write_cache(path: Path, data: Dict) -> None:
+    """Write a cache file atomically so concurrent runs never see a partial file"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        payload = orjson.dumps(data) if orjson else json.dumps(data).encode()
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Caching is best-effort
+        pass
+
+
+def load_cached_services(profile: Optional[str], cluster_arn: str) -> Optional[List[str]]:
+    """Get cached service ARNs for a cluster, or None if missing or expired"""
+    entry = _read_cache(SERVICES_CACHE_FILE).get(_services_key(profile, cluster_arn))
+    if not entry or time.time() - entry.get('ts', 0) > SERVICES_CACHE_TTL:
+        return None
+    # An empty list may be a failed listing; never serve it as a hit
+    return entry.get('services') or None
+
+
+def save_cached_services(profile: Optional[str], cluster_arn: str, services: List[str]) -> None:
+    """Store service ARNs for a cluster, dropping expired entries.
+
+    Empty lists are not stored: list_services also returns [] when the call fails.
+    """
+    if not services:
+        return
+    now = time.time()
+    data = {
+        key: entry for key, entry in _read_cache(SERVICES_CACHE_FILE).items()
+        if now - entry.get('ts', 0) <= SERVICES_CACHE_TTL
+    }
+    data[_services_key(profile, cluster_arn)] = {'ts': now, 'services': services}
+    _write_cache(SERVICES_CACHE_FILE, data)
+
+
+def load_cached_clusters(source: Dict) -> Tuple[Optional[List[Dict]], Optional[float]]:
+    """Get the cached cluster list for a configuration and when it was saved, or (None, None)"""
+    entry = _read_cache(CLUSTERS_CACHE_FILE).get(_clusters_key(source))
+    if not entry or time.time() - entry.get('ts', 0) > CLUSTERS_CACHE_TTL:
+        return None, None
+    return entry.get('clusters'), entry['ts']
+
+
+def save_cached_clusters(source: Dict, clusters: List[Dict]) -> None:
+    """Store the cluster list for a configuration, dropping expired entries"""
+    now = time.time()
+    data = {
+        key: entry for key, entry in _read_cache(CLUSTERS_CACHE_FILE).items()
+        if now - entry.get('ts', 0) <= CLUSTERS_CACHE_TTL
+    }
+    data[_clusters_key(source)] = {'ts': now, 'clusters': clusters}
+    _write_cache(CLUSTERS_CACHE_FILE, data)
@@ -6,6 +6,7 @@ from .config_manager import get_configured_regions, get_configured_accounts
 REGIONS = get_configured_regions()
 
 ECS_AGENT_CONTAINER_NAME = "ecs-agent"
+ECS_AGENT_CONTAINER_NAME_LOWER = ECS_AGENT_CONTAINER_NAME.lower()
 
 
 def reload_regions():
@@ -14,7 +14,9 @@ import subprocess
 import platform
 import os
 from .aws_client import AWSClient
-from .live_logs import parse_log_level, LogLoaderApp
+from .live_logs import parse_log_level, format_log_time, LogLoaderApp
+
+DOWNLOADS_DIR = Path.home() / "Downloads"
 
 
 class DownloadLogsApp(App):
@@ -158,44 +160,48 @@ class DownloadLogsApp(App):
         end_time = int(time.time() * 1000)
         start_time = end_time - (self.minutes * 60 * 1000)
 
-        events = self.aws.get_log_events(
-            self.log_group,
-            self.log_stream,
-            start_time=start_time,
-            end_time=end_time,
-            limit=10000
-        )
-
-        if not events:
-            return {'events': [], 'stats': {}, 'path': None}
-
-        # Count by log level
-        stats = {'DEBUG': 0, 'INFO': 0, 'WARNING': 0, 'ERROR': 0, 'CRITICAL': 0}
-        for event in events:
-            level = parse_log_level(event.get('message', ''))
-            if level in stats:
-                stats[level] += 1
-            else:
-                stats['INFO'] += 1
-
         # Prepare download path
-        downloads_dir = Path.home() / "Downloads"
-        downloads_dir.mkdir(exist_ok=True)
+        DOWNLOADS_DIR.mkdir(exist_ok=True)
 
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"ecs_logs_{self.container_name}_{self.task_id}_{timestamp}.log"
-        filepath = downloads_dir / filename
+        filepath = DOWNLOADS_DIR / filename
 
-        # Write logs to file
-        with open(filepath, 'w') as f:
-            for event in events:
+        # Write logs to file page by page as they arrive, counting by log level
+        stats = {'DEBUG': 0, 'INFO': 0, 'WARNING': 0, 'ERROR': 0, 'CRITICAL': 0}
+        count = 0
+
+        def lines():
+            nonlocal count
+            for event in self.aws.iter_log_events(
+                self.log_group,
+                self.log_stream,
+                start_time=start_time,
+                end_time=end_time
+            ):
                 ts = event.get('timestamp', 0)
                 message = event.get('message', '')
-                dt = datetime.fromtimestamp(ts / 1000)
-                time_str = dt.strftime('%Y-%m-%d %H:%M:%S')
-                f.write(f"{time_str} {message}\n")
-
-        return {'events': events, 'stats': stats, 'path': filepath}
+                level = parse_log_level(message)
+                if level in stats:
+                    stats[level] += 1
+                else:
+                    stats['INFO'] += 1
+                count += 1
+                yield f"{format_log_time(ts // 1000, '%Y-%m-%d %H:%M:%S')} {message}\n"
+
+        error = None
+        with open(filepath, 'w', buffering=1 << 16) as f:
+            try:
+                f.writelines(lines())
+            except Exception as e:
+                # Keep what was written, but report the download as partial
+                error = str(e)
+
+        if not count:
+            filepath.unlink(missing_ok=True)
+            return {'count': 0, 'stats': {}, 'path': None, 'error': error}
+
+        return {'count': count, 'stats': stats, 'path': filepath, 'error': error}
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         if event.state != WorkerState.SUCCESS:
@@ -213,11 +219,19 @@ class DownloadLogsApp(App):
         loading = self.query_one("#loading", Container)
         loading.remove()
 
-        events = result.get('events', [])
+        count = result.get('count', 0)
         stats = result.get('stats', {})
         filepath = result.get('path')
+        error = result.get('error')
 
-        if not events:
+        if not count and error:
+            result_box = Container(
+                Static("Download Failed", id="result-title"),
+                Static(f"[red]Error fetching logs: {error}[/red]", id="result-stats"),
+                Static("Press Enter to continue", id="result-hint"),
+                id="result-box"
+            )
+        elif not count:
             # No logs found
             result_box = Container(
                 Static("No Logs Found", id="result-title"),
@@ -227,7 +241,7 @@ class DownloadLogsApp(App):
             )
         else:
             # Build stats display
-            total = len(events)
+            total = count
             stats_parts = []
 
             # Order: DEBUG, INFO, WARNING, ERROR (with colors)
@@ -242,9 +256,11 @@ class DownloadLogsApp(App):
                 stats_parts.append(f"[red]{error_count} error[/red]")
 
             stats_line = " | ".join(stats_parts) if stats_parts else ""
+            if error:
+                stats_line += f"\n\n[red]Stopped early, file is incomplete: {error}[/red]"
 
             result_box = Container(
-                Static("Download Complete", id="result-title"),
+                Static("Download Incomplete" if error else "Download Complete", id="result-title"),
                 Static(f"[bold cyan]{total}[/bold cyan] log entries\n\n{stats_line}", id="result-stats"),
                 Static(f"[dim]Saved to:[/dim]\n[@click=open_file('{filepath}')]{filepath}[/]", id="result-path"),
                 Static("Press Enter to continue", id="result-hint"),
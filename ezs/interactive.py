@@ -1,16 +1,19 @@
 """Interactive CLI prompts using Textual"""
 
+import time
 from typing import List, Optional, Union, Dict, Any, Callable
 from textual.app import App, ComposeResult
 from textual.widgets import Input, OptionList, Static, LoadingIndicator, Button, SelectionList, Footer
 from textual.widgets.option_list import Option
 from textual.containers import Container, VerticalScroll, Horizontal
 from textual.binding import Binding
-from textual.worker import Worker, WorkerState
+from textual.worker import Worker, WorkerState, get_current_worker
 from textual.screen import ModalScreen
+from textual.reactive import reactive
 from datetime import datetime
-from .aws_client import extract_name_from_arn
+from .aws_client import extract_name_from_arn, map_in_pool
 from .config_manager import get_prefetch_enabled
+from .cache import load_cached_services, save_cached_services
 
 
 class ExitConfirmModal(ModalScreen):
@@ -191,6 +194,16 @@ class ConfirmModal(ModalScreen):
         self.dismiss(event.button.id == "yes")
 
 
+class SelectionCounter(Static):
+    """Shows "selected/total selected", repainting only when a count changes"""
+
+    selected = reactive(0)
+    total = reactive(0)
+
+    def render(self) -> str:
+        return f"{self.selected}/{self.total} selected"
+
+
 class RedeployServicesModal(ModalScreen):
     """Modal to select services for force redeployment"""
 
@@ -274,15 +287,21 @@ class RedeployServicesModal(ModalScreen):
     def __init__(self, services: list):
         super().__init__()
         self.services = services
+        self._service_names = [extract_name_from_arn(svc) for svc in services]
         self.selected_services: set = set()
         self._focus_area = "list"  # "list", "cancel", "ok"
+        self._services_list = None
+        self._counter = None
 
     def compose(self) -> ComposeResult:
+        # Keep handles so key handlers don't query the DOM
+        self._services_list = OptionList(id="redeploy-services")
+        self._counter = SelectionCounter(id="redeploy-counter")
         yield Container(
             Static("Force Redeploy Services", id="redeploy-title"),
             Static("Space: toggle | A: select all | Enter: confirm", id="redeploy-hint"),
-            OptionList(id="redeploy-services"),
-            Static("0 selected", id="redeploy-counter"),
+            self._services_list,
+            self._counter,
             Horizontal(
                 Button("Cancel", id="cancel", classes="modal-btn"),
                 Button("OK", id="ok", classes="modal-btn"),
@@ -293,18 +312,16 @@ class RedeployServicesModal(ModalScreen):
 
     def on_mount(self) -> None:
         self._render_services()
-        self.query_one("#redeploy-services", OptionList).focus()
+        self._services_list.focus()
 
     def _render_services(self) -> None:
         """Render services with checkboxes"""
-        option_list = self.query_one("#redeploy-services", OptionList)
+        option_list = self._services_list
         highlighted = option_list.highlighted
         option_list.clear_options()
-
-        for svc in self.services:
-            svc_name = extract_name_from_arn(svc)
-            checkbox = "[■]" if svc in self.selected_services else "[ ]"
-            option_list.add_option(Option(f"{checkbox} {svc_name}"))
+        option_list.add_options(
+            Option(self._service_label(idx)) for idx in range(len(self.services))
+        )
 
         # Restore highlight position
         if highlighted is not None and highlighted < len(self.services):
@@ -314,16 +331,20 @@ class RedeployServicesModal(ModalScreen):
 
         self._update_counter()
 
+    def _service_label(self, idx: int) -> str:
+        """Checkbox label for the service at idx"""
+        checkbox = "[■]" if self.services[idx] in self.selected_services else "[ ]"
+        return f"{checkbox} {self._service_names[idx]}"
+
     def _update_counter(self) -> None:
         """Update selection counter"""
-        count = len(self.selected_services)
-        total = len(self.services)
-        counter = self.query_one("#redeploy-counter", Static)
-        counter.update(f"{count}/{total} selected")
+        counter = self._counter
+        counter.selected = len(self.selected_services)
+        counter.total = len(self.services)
 
     def _toggle_current(self) -> None:
         """Toggle selection of currently highlighted service"""
-        option_list = self.query_one("#redeploy-services", OptionList)
+        option_list = self._services_list
         idx = option_list.highlighted
         if idx is not None and 0 <= idx < len(self.services):
             svc = self.services[idx]
@@ -331,7 +352,8 @@ class RedeployServicesModal(ModalScreen):
                 self.selected_services.discard(svc)
             else:
                 self.selected_services.add(svc)
-            self._render_services()
+            option_list.replace_option_prompt_at_index(idx, self._service_label(idx))
+            self._update_counter()
 
     def _select_all(self) -> None:
         """Select or deselect all services"""
@@ -369,7 +391,7 @@ class RedeployServicesModal(ModalScreen):
                 self.query_one("#ok", Button).focus()
             else:
                 self._focus_area = "list"
-                self.query_one("#redeploy-services", OptionList).focus()
+                self._services_list.focus()
             event.prevent_default()
             event.stop()
         elif event.key == "shift+tab":
@@ -382,7 +404,7 @@ class RedeployServicesModal(ModalScreen):
                 self.query_one("#cancel", Button).focus()
             else:
                 self._focus_area = "list"
-                self.query_one("#redeploy-services", OptionList).focus()
+                self._services_list.focus()
             event.prevent_default()
             event.stop()
 
@@ -506,6 +528,39 @@ class BackSignal:
 
 BACK = BackSignal()
 
+# Clusters (in display order) whose services are listed in the background
+SERVICES_PREFETCH_LIMIT = 50
+
+# Region boxes mounted at a time in the cluster view; more follow on scroll
+CLUSTER_VIEW_REGION_BATCH = 8
+
+# (minutes, label) choices for log downloads
+TIME_RANGE_OPTIONS = [
+    (5, "Last 5 minutes"),
+    (15, "Last 15 minutes"),
+    (30, "Last 30 minutes"),
+    (60, "Last 1 hour"),
+    (120, "Last 2 hours"),
+    (360, "Last 6 hours"),
+    (720, "Last 12 hours"),
+    (1440, "Last 24 hours"),
+]
+
+
+def _display_container(c: dict) -> str:
+    """Format container for display"""
+    return f"{c['name']} ({c.get('lastStatus', 'unknown')})"
+
+
+def _display_time_option(option: tuple) -> str:
+    """Format (minutes, label) time range for display"""
+    return option[1]
+
+
+def _is_narrowing(previous: Optional[str], current: str) -> bool:
+    """True if everything matching `current` also matched `previous`"""
+    return previous is not None and previous in current
+
 
 class ECSConnectApp(App):
     """Single persistent app for EZS navigation"""
@@ -690,9 +745,11 @@ class ECSConnectApp(App):
     ]
 
     def __init__(self, clusters: List[dict], aws_client_factory, profile: Optional[str] = None,
-                 initial_cluster: Optional[dict] = None, resume_context: Optional[dict] = None):
+                 initial_cluster: Optional[dict] = None, resume_context: Optional[dict] = None,
+                 clusters_at: Optional[float] = None):
         super().__init__()
         self.all_clusters = clusters
+        self.clusters_at = clusters_at  # when the cluster list was fetched, if known
         self.aws_client_factory = aws_client_factory
         self.profile = profile  # CLI override, takes precedence
         self.initial_cluster = initial_cluster
@@ -702,6 +759,7 @@ class ECSConnectApp(App):
         self.step = "cluster"  # cluster, service, task, task_menu, container, confirm, time_select
         self.selected_cluster = None
         self.selected_service = None
+        self._selected_service_name = ''
         self.selected_task = None
         self.selected_container = None
         self.selected_action = None  # For logs actions
@@ -712,6 +770,8 @@ class ECSConnectApp(App):
         self.cached_services = {}  # cluster_arn -> services
         self.cached_tasks = {}     # (cluster_arn, service) -> tasks
         self.cached_containers = {}  # task_arn -> (instance_id, containers)
+        self._prefetched_clusters = set()  # cluster ARNs whose tasks/containers were prefetched
+        self._prefetch_enabled = get_prefetch_enabled()  # read config once, not per selection
         self.services = []
         self.tasks = []
         self.containers = []
@@ -720,9 +780,11 @@ class ECSConnectApp(App):
         self.regions_order = []
         self.clusters_by_region = {}
         self.nav_list = []  # Flat list for cluster navigation
+        self._nav_by_list_idx = {}  # (list_id, option index) -> nav_list index
 
         # Temporary status timer
         self._temp_status_timer = None
+        self._pending_filter_timer = None  # debounced search filter
         self.nav_index = 0
 
         # Navigation for other views
@@ -733,44 +795,81 @@ class ECSConnectApp(App):
         # Result
         self.result = None  # Will be set when user makes final choice
         self.cancelled = False
-        self._render_id = 0  # For unique widget IDs
-        self._current_options_id = None  # Current options list ID
 
-        # Group clusters by account > region
-        self.accounts_order = []
+        # Persistent widgets of the current view, filtered in place on keystrokes
+        # Widget handles, built in compose
+        self._title_bar = None
+        self._status_bar = None
+        self._search_input = None
+        self._scroll_area = None
+        self._options_list = None  # list view OptionList, shared by all list steps
+        self._menu_lists = {}  # section -> OptionList in task_menu/confirm views
+        self._confirm_filter = None  # filter applied to the confirm view's sections
+        self._help_overlay = None  # built in compose
+        self._loading_overlay = None  # mounted by _show_loading while a worker runs
+        self._loading_message = None
+        self._item_labels = []
+        self._item_labels_lower = []
+        self._shown = []  # item indices currently shown in the list view
+        self._shown_filter = None  # filter that produced _shown
+        self._list_view_key = None  # cache_key of the items the list view currently holds
+        self._shown_history = {}  # filter -> shown indices, for the current render
+        self._cluster_lists = {}  # (account, region) -> (RegionBox, OptionList)
+        self._cluster_shown = {}  # (account, region) -> cluster indices shown
+        self._cluster_list_keys = {}  # OptionList id -> (account, region)
+        self._regions_mounted = 0  # leading region boxes mounted so far
+        self._highlighted_cluster_list = None  # OptionList holding the cluster highlight
+        self._cluster_filter = None  # filter that produced _cluster_shown
+        self._cluster_shown_history = {}  # filter -> _cluster_shown, for the current render
+        self._labels_cache = {}  # view key -> (items, labels, lower-cased labels)
+
+        # Group clusters by account > region (dicts keep first-seen order)
         self.clusters_by_account_region = {}  # (account, region) -> [clusters]
         for c in clusters:
-            account = c.get('account_name', 'default')
-            region = c['region']
-            key = (account, region)
-            if account not in self.accounts_order:
-                self.accounts_order.append(account)
-            if key not in self.clusters_by_account_region:
-                self.regions_order.append(key)
-                self.clusters_by_account_region[key] = []
-            self.clusters_by_account_region[key].append(c)
-
-        # Legacy compat: also build clusters_by_region for single-account
-        for c in clusters:
-            region = c['region']
-            if region not in self.clusters_by_region:
-                self.clusters_by_region[region] = []
-            self.clusters_by_region[region].append(c)
+            key = (c.get('account_name', 'default'), c['region'])
+            self.clusters_by_account_region.setdefault(key, []).append(c)
+            # Legacy compat: also build clusters_by_region for single-account
+            self.clusters_by_region.setdefault(c['region'], []).append(c)
+        self.regions_order = list(self.clusters_by_account_region)
+        self._region_position = {key: i for i, key in enumerate(self.regions_order)}
+        self.accounts_order = list(dict.fromkeys(account for account, _ in self.regions_order))
 
         self.multi_account = len(self.accounts_order) > 1
 
+        # Lower-cased cluster names for the search filter, built once
+        self._cluster_names_lower = {
+            key: [c['name'].lower() for c in cs]
+            for key, cs in self.clusters_by_account_region.items()
+        }
+
     def compose(self) -> ComposeResult:
-        yield Static("Select ECS Cluster", id="title")
-        yield Static("", id="status")
-        yield CustomInput(placeholder="Type to filter...", id="search")
-        yield VerticalScroll(id="scroll-area")
+        self._title_bar = Static("Select ECS Cluster", id="title")
+        self._status_bar = Static("", id="status")
+        self._search_input = CustomInput(placeholder="Type to filter...", id="search")
+        self._options_list = OptionList(id="list-view")
+        self._options_list.display = False
+        self._scroll_area = VerticalScroll(self._options_list, id="scroll-area")
+        yield self._title_bar
+        yield self._status_bar
+        yield self._search_input
+        yield self._scroll_area
         yield Footer()
+        # Mounted once and toggled with F1
+        self._help_overlay = Container(Static(HELP_TEXT, markup=True), id="help-overlay")
+        self._help_overlay.display = False
+        yield self._help_overlay
 
     def on_mount(self) -> None:
+        self.watch(
+            self._scroll_area, "scroll_y",
+            lambda _: self._fill_cluster_viewport(), init=False
+        )
         if self.resume_context:
             # Resume from Select Action with full context
             self.selected_cluster = self.resume_context.get('cluster')
             self.selected_service = self.resume_context.get('service')
+            if self.selected_service:
+                self._selected_service_name = extract_name_from_arn(self.selected_service)
             self.selected_task = self.resume_context.get('task')
             self.selected_container = self.resume_context.get('container')
             self._instance_id = self.resume_context.get('instance_id')
@@ -782,6 +881,8 @@ class ECSConnectApp(App):
                 self.cached_tasks = self.resume_context['cached_tasks']
             if self.resume_context.get('cached_containers'):
                 self.cached_containers = self.resume_context['cached_containers']
+            if self.resume_context.get('prefetched_clusters'):
+                self._prefetched_clusters = self.resume_context['prefetched_clusters']
 
             # Invalidate cache for redeployed service (from env_viewer)
             invalidate_service = self.resume_context.get('invalidate_service')
@@ -812,26 +913,72 @@ class ECSConnectApp(App):
                         _, self.containers = self.cached_containers[task_arn]
 
             if self.selected_cluster:
-                self.aws = self.aws_client_factory(
-                    region=self.selected_cluster['region'],
-                    profile=self._get_cluster_profile()
-                )
+                self.aws = self._get_aws(self.selected_cluster)
                 self._go_to_confirm(self._instance_id)
             else:
                 self._render_cluster_view()
-                self.query_one("#search", CustomInput).focus()
+                self._search_input.focus()
+                self._start_services_prefetch()
         elif self.initial_cluster:
             # Resume from service selection for the given cluster
             self.selected_cluster = self.initial_cluster
-            self.aws = self.aws_client_factory(
-                region=self.initial_cluster['region'],
-                profile=self._get_cluster_profile()
-            )
+            self.aws = self._get_aws(self.initial_cluster)
             self._go_to_service()
         else:
             self.refresh_bindings()
             self._render_cluster_view()
-            self.query_one("#search", CustomInput).focus()
+            self._search_input.focus()
+            self._start_services_prefetch()
+
+    def _start_services_prefetch(self) -> None:
+        """Warm cached_services in the background while the user picks a cluster.
+
+        Runs in the default worker group, so the exclusive worker started when
+        a cluster needs fetching cancels it.
+        """
+        if not self._prefetch_enabled:
+            return
+        self.run_worker(
+            self._prefetch_services,
+            name="prefetch_services",
+            thread=True
+        )
+
+    def _prefetch_services(self) -> None:
+        """Worker: list services for clusters that are not cached yet"""
+        worker = get_current_worker()
+        clusters = [
+            c for key in self.regions_order for c in self.clusters_by_account_region[key]
+            if c['arn'] not in self.cached_services
+        ][:SERVICES_PREFETCH_LIMIT]
+
+        clients = {}
+        for c in clusters:
+            key = (c['region'], self._get_cluster_profile(c))
+            if key not in clients:
+                try:
+                    clients[key] = self._get_aws(c)
+                except Exception:
+                    clients[key] = None
+
+        def fetch(cluster):
+            aws = clients[(cluster['region'], self._get_cluster_profile(cluster))]
+            if aws is None or worker.is_cancelled:
+                return
+            services = aws.list_services(cluster['arn'])
+            # Empty may mean an error; leave those to the foreground fetch
+            if services and not worker.is_cancelled:
+                self.call_from_thread(self._store_prefetched_services, cluster['arn'], services)
+
+        map_in_pool(fetch, clusters)
+
+    def _store_prefetched_services(self, cluster_arn: str, services: list) -> None:
+        """Cache services listed in the background, keeping fresher entries"""
+        self.cached_services.setdefault(cluster_arn, services)
+
+    def _get_aws(self, cluster: dict) -> Any:
+        """Get the AWS client for a cluster's region and profile (the factory reuses clients)"""
+        return self.aws_client_factory(region=cluster['region'], profile=self._get_cluster_profile(cluster))
 
     def _get_cluster_profile(self, cluster: dict = None) -> Optional[str]:
         """Get AWS profile for a cluster. CLI --profile overrides cluster-level profile."""
@@ -844,161 +991,289 @@ class ECSConnectApp(App):
 
     def _set_status(self, message: str) -> None:
         """Update status bar"""
-        self.query_one("#status", Static).update(message)
+        self._status_bar.update(message)
 
     def _show_loading(self, message: str = "Loading...") -> None:
         """Show loading overlay centered on screen with spinner"""
-        # Remove all existing loading overlays first
+        # Remove any existing loading overlay first
         self._hide_loading()
-        self._render_id += 1
+        self._loading_message = Static(message, markup=True)
         loading_box = Container(
             LoadingIndicator(),
-            Static(message, markup=True),
+            self._loading_message,
             id="loading-box"
         )
-        overlay = Container(loading_box, classes="loading-overlay")
-        self.mount(overlay)
+        self._loading_overlay = Container(loading_box, classes="loading-overlay")
+        self.mount(self._loading_overlay)
 
     def _hide_loading(self) -> None:
-        """Hide all loading overlays"""
-        for overlay in self.query(".loading-overlay"):
-            overlay.remove()
+        """Hide the loading overlay"""
+        if self._loading_overlay is not None:
+            self._loading_overlay.remove()
+            self._loading_overlay = None
+            self._loading_message = None
 
     def _is_loading(self) -> bool:
-        """Check if loading overlay is visible"""
-        return len(self.query(".loading-overlay")) > 0
+        """Check if loading overlay is visible (checked on every key press)"""
+        return self._loading_overlay is not None
 
     def _show_help(self) -> None:
         """Show help overlay"""
-        try:
-            self.query_one("#help-overlay").remove()
-        except Exception:
-            pass
-        overlay = Container(Static(HELP_TEXT, markup=True), id="help-overlay")
-        self.mount(overlay)
+        self._help_overlay.display = True
 
     def _hide_help(self) -> None:
         """Hide help overlay"""
-        try:
-            self.query_one("#help-overlay").remove()
-        except Exception:
-            pass
+        self._help_overlay.display = False
 
     def _set_title(self, title: str) -> None:
         """Update title bar"""
-        self.query_one("#title", Static).update(title)
+        self._title_bar.update(title)
 
     def _clear_scroll_area(self) -> None:
         """Clear the scroll area"""
-        scroll = self.query_one("#scroll-area", VerticalScroll)
-        # Remove all children explicitly
+        scroll = self._scroll_area
+        # Remove all children explicitly, keeping the shared list view hidden
         for child in list(scroll.children):
-            child.remove()
+            if child is not self._options_list:
+                child.remove()
+        self._options_list.display = False
+        self._cluster_lists = {}
+        self._menu_lists = {}
 
     # ==================== CLUSTER VIEW ====================
 
     def _render_cluster_view(self, filter_text: str = "") -> None:
         """Render cluster selection with account > region boxes"""
         self._set_title("Select ECS Cluster")
+        self._set_status(self._cluster_list_age())
         self._clear_scroll_area()
 
-        scroll = self.query_one("#scroll-area", VerticalScroll)
-        filter_lower = filter_text.lower() if filter_text else ""
-
-        self.nav_list = []
-        self._list_ids = []  # track all option list IDs for highlight clearing
+        self._cluster_shown = {}
+        self._cluster_filter = None
+        self._cluster_shown_history = {}
+        self._cluster_list_keys = {}
+        self._regions_mounted = 0
+        self._highlighted_cluster_list = None
 
         for account_region_key in self.regions_order:
             account_name, region = account_region_key
             clusters = self.clusters_by_account_region[account_region_key]
 
-            if filter_lower:
-                filtered = [c for c in clusters if filter_lower in c['name'].lower()]
-            else:
-                filtered = clusters
-
-            if not filtered:
-                continue
-
             # Build unique list ID
             list_id = f"list-{account_name}-{region}"
 
+            # Boxes are built for every region but mounted lazily
             region_name = clusters[0]['region_name']
+            option_list = OptionList(*[Option(c['name']) for c in clusters], id=list_id)
+            # OptionList highlights its first row; only the nav item's list should
+            option_list.highlighted = None
+            box = RegionBox(region_name, region, option_list)
             if self.multi_account:
-                box = RegionBox(region_name, region)
                 box.border_title = f" {account_name} / {region_name} ({region}) "
             else:
-                box = RegionBox(region_name, region)
                 box.border_title = f" {region_name} ({region}) "
-            scroll.mount(box)
 
-            option_list = OptionList(id=list_id)
-            box.mount(option_list)
-            self._list_ids.append(list_id)
+            self._cluster_lists[account_region_key] = (box, option_list)
+            self._cluster_list_keys[list_id] = account_region_key
+            self._cluster_shown[account_region_key] = list(range(len(clusters)))
+
+        self._filter_cluster_view(filter_text)
+        self._mount_more_regions()
+
+    def _cluster_list_age(self) -> str:
+        """Status hint for a cluster list that was not fetched just now"""
+        if self.clusters_at is None:
+            return ""
+        age = time.time() - self.clusters_at
+        if age < 5:
+            return ""
+        minutes = int(age // 60)
+        when = f"{minutes}m ago" if minutes else "under a minute ago"
+        return f"Cluster list cached {when} · run ezs --refresh to reload"
+
+    def _mount_more_regions(self, through_key: Optional[tuple] = None) -> None:
+        """Mount the next batch of non-empty region boxes, or all boxes up to through_key"""
+        boxes = [box for box, _ in self._cluster_lists.values()]
+        end = self._regions_mounted
+        if through_key is not None:
+            end = self._region_position[through_key] + 1
+        else:
+            visible = 0
+            while end < len(boxes) and visible < CLUSTER_VIEW_REGION_BATCH:
+                if boxes[end].display:
+                    visible += 1
+                end += 1
+        if end <= self._regions_mounted:
+            return
+
+        scroll = self._scroll_area
+        scroll.mount_all(boxes[self._regions_mounted:end])
+        self._regions_mounted = end
+        self.call_after_refresh(self._fill_cluster_viewport)
+
+    def _fill_cluster_viewport(self) -> None:
+        """Mount more regions once the user scrolls near the end of the mounted ones"""
+        if self.step != "cluster" or self._regions_mounted >= len(self._cluster_lists):
+            return
+        scroll = self._scroll_area
+        if scroll.max_scroll_y - scroll.scroll_y <= scroll.size.height:
+            self._mount_more_regions()
+
+    def _filter_cluster_view(self, filter_text: str) -> None:
+        """Filter cluster lists in place, hiding regions without matches"""
+        filter_lower = filter_text.lower() if filter_text else ""
+        if filter_lower == self._cluster_filter:
+            return
+        # A longer query can only match a subset of what the previous one did;
+        # a query seen before (e.g. after backspace) reuses its earlier result
+        narrowing = _is_narrowing(self._cluster_filter, filter_lower)
+        first_pass = self._cluster_filter is None
+        self._cluster_filter = filter_lower
+
+        new_shown = self._cluster_shown_history.get(filter_lower)
+        if new_shown is None:
+            new_shown = {}
+            for account_region_key, names_lower in self._cluster_names_lower.items():
+                if filter_lower:
+                    candidates = self._cluster_shown[account_region_key] if narrowing else range(len(names_lower))
+                    new_shown[account_region_key] = [i for i in candidates if filter_lower in names_lower[i]]
+                else:
+                    new_shown[account_region_key] = list(range(len(names_lower)))
+            self._cluster_shown_history[filter_lower] = new_shown
+
+        # Same matches as before: keep lists, navigation and highlight as they are
+        if not first_pass and new_shown == self._cluster_shown:
+            return
+
+        self.nav_list = []
+        self._nav_by_list_idx = {}
+
+        for account_region_key, (box, option_list) in self._cluster_lists.items():
+            clusters = self.clusters_by_account_region[account_region_key]
+            shown = new_shown[account_region_key]
+
+            self._apply_option_filter(
+                option_list, self._cluster_shown[account_region_key], shown,
+                lambda i: clusters[i]['name']
+            )
+            box.display = bool(shown)
 
-            for idx, c in enumerate(filtered):
-                option_list.add_option(Option(c['name']))
-                self.nav_list.append((list_id, idx, c))
+            for idx, i in enumerate(shown):
+                self._nav_by_list_idx[(option_list.id, idx)] = len(self.nav_list)
+                self.nav_list.append((option_list.id, idx, clusters[i]))
+
+        self._cluster_shown = dict(new_shown)
 
         # Reset navigation and highlight first item
         self.nav_index = 0
         if self.nav_list:
             self.call_after_refresh(self._update_cluster_highlight)
+        # Hiding regions may have left the viewport short of mounted ones
+        self.call_after_refresh(self._fill_cluster_viewport)
+
+    def _apply_option_filter(self, option_list: OptionList, shown: List[int],
+                             new_shown: List[int], label_fn: Callable) -> None:
+        """Update option_list from one filtered index list to another.
+
+        The list is rebuilt in one go: OptionList re-indexes every later row on
+        each remove_option_at_index, so dropping rows one at a time is slower.
+        """
+        if new_shown == shown:
+            return
+        option_list.clear_options()
+        option_list.add_options([Option(label_fn(i)) for i in new_shown])
+        # Callers set the highlight they want on the rebuilt list
+        option_list.highlighted = None
 
     def _update_cluster_highlight(self) -> None:
         """Update visual highlight for cluster view"""
-        # Clear all highlights
-        for list_id in getattr(self, '_list_ids', []):
-            try:
-                option_list = self.query_one(f"#{list_id}", OptionList)
-                option_list.highlighted = None
-            except Exception:
-                pass
+        # Clear the previous highlight
+        if self._highlighted_cluster_list is not None:
+            self._highlighted_cluster_list.highlighted = None
+            self._highlighted_cluster_list = None
 
         # Set highlight on current nav item
         if self.nav_list and 0 <= self.nav_index < len(self.nav_list):
             list_id, local_idx, _ = self.nav_list[self.nav_index]
-            try:
-                option_list = self.query_one(f"#{list_id}", OptionList)
-                option_list.highlighted = local_idx
-                option_list.scroll_to_highlight()
-            except Exception:
-                pass
+            key = self._cluster_list_keys.get(list_id)
+            if key is None:
+                return
+            if self._region_position[key] >= self._regions_mounted:
+                # Navigated past the mounted regions; mount through this one first
+                self._mount_more_regions(through_key=key)
+                self.call_after_refresh(self._update_cluster_highlight)
+                return
+            _, option_list = self._cluster_lists[key]
+            option_list.highlighted = local_idx
+            option_list.scroll_to_highlight()
+            self._highlighted_cluster_list = option_list
 
     # ==================== LIST VIEW (services, tasks, containers, confirm) ====================
 
     def _render_list_view(self, title: str, items: List[Any], display_fn: Callable,
-                          filter_text: str = "") -> None:
-        """Render a simple list view"""
+                          filter_text: str = "", cache_key: Optional[tuple] = None) -> None:
+        """Render a simple list view.
+
+        With cache_key, display strings are reused until the items list changes,
+        and returning to a view whose items are unchanged keeps the list as it was.
+        """
         self._set_title(title)
         self._clear_scroll_area()
-        self._render_id += 1
+        self._options_list.display = True
 
-        scroll = self.query_one("#scroll-area", VerticalScroll)
-        self._current_options_id = f"options-{self._render_id}"
-        option_list = OptionList(id=self._current_options_id)
-        scroll.mount(option_list)
+        if cache_key and cache_key == self._list_view_key and items is self.items:
+            self._filter_list_view(filter_text)
+            return
 
+        self._options_list.clear_options()
+        self._list_view_key = cache_key
         self.items = items
-        self.index_to_item = {}
-        self.first_item_idx = None
+        cached = self._labels_cache.get(cache_key) if cache_key else None
+        if cached is None or cached[0] is not items:
+            labels = [display_fn(item) for item in items]
+            cached = (items, labels, [label.lower() for label in labels])
+            if cache_key:
+                self._labels_cache[cache_key] = cached
+        _, self._item_labels, self._item_labels_lower = cached
+        self._shown = []
+        self._shown_filter = None
+        self._shown_history = {}
+        self._filter_list_view(filter_text)
+
+    def _filter_list_view(self, filter_text: str) -> None:
+        """Filter the current list view in place"""
+        option_list = self._options_list
+        if not option_list.display:
+            return
 
-        option_idx = 0
         filter_lower = filter_text.lower() if filter_text else ""
-        total_matches = 0
+        if filter_lower == self._shown_filter:
+            return
+        # Reuse the result for a query seen before (e.g. after backspace)
+        shown = self._shown_history.get(filter_lower)
+        if shown is None:
+            if filter_lower:
+                labels_lower = self._item_labels_lower
+                if _is_narrowing(self._shown_filter, filter_lower):
+                    candidates = self._shown
+                else:
+                    candidates = range(len(labels_lower))
+                shown = [i for i in candidates if filter_lower in labels_lower[i]]
+            else:
+                shown = list(range(len(self.items)))
+            self._shown_history[filter_lower] = shown
 
-        # Add items
-        for item in items:
-            display = display_fn(item)
-            if filter_lower and filter_lower not in display.lower():
-                continue
+        first_pass = self._shown_filter is None
+        self._shown_filter = filter_lower
+        # Same matches as before: keep the list and highlight as they are
+        if not first_pass and shown == self._shown:
+            return
 
-            option_list.add_option(Option(display))
-            self.index_to_item[option_idx] = item
-            if self.first_item_idx is None:
-                self.first_item_idx = option_idx
-            option_idx += 1
-            total_matches += 1
+        labels = self._item_labels
+        self._apply_option_filter(option_list, self._shown, shown, lambda i: labels[i])
+        self._shown = shown
+        self.index_to_item = {idx: self.items[i] for idx, i in enumerate(shown)}
+        self.first_item_idx = 0 if shown else None
 
         # Highlight first item (not back)
         if self.first_item_idx is not None:
@@ -1010,8 +1285,7 @@ class ECSConnectApp(App):
         """Go to cluster selection"""
         self.step = "cluster"
         self.refresh_bindings()
-        self._set_status("")
-        search = self.query_one("#search", CustomInput)
+        search = self._search_input
         search.value = ""
         search.placeholder = "Type to filter clusters..."
         self._render_cluster_view()
@@ -1024,6 +1298,7 @@ class ECSConnectApp(App):
         cluster_arn = self.selected_cluster['arn']
 
         # Use cache if available
+        self._load_disk_cached_services(cluster_arn)
         if cluster_arn in self.cached_services:
             self.services = self.cached_services[cluster_arn]
             self._render_service_view()
@@ -1036,6 +1311,14 @@ class ECSConnectApp(App):
                 thread=True
             )
 
+    def _load_disk_cached_services(self, cluster_arn: str) -> None:
+        """Fill cached_services from the on-disk cache if it has a fresh entry"""
+        if cluster_arn in self.cached_services:
+            return
+        services = load_cached_services(self._get_cluster_profile(), cluster_arn)
+        if services is not None:
+            self.cached_services[cluster_arn] = services
+
     def _fetch_services(self) -> list:
         """Worker: fetch services from AWS"""
         cluster_arn = self.selected_cluster['arn']
@@ -1050,16 +1333,38 @@ class ECSConnectApp(App):
 
         return self.aws.prefetch_cluster_hierarchy(cluster_arn, update_progress)
 
+    def _start_hierarchy_prefetch(self) -> None:
+        """Prefetch tasks and containers of the selected cluster while its services are shown.
+
+        Runs in the default worker group, so a foreground fetch cancels it.
+        """
+        aws = self.aws
+        cluster_arn = self.selected_cluster['arn']
+        self.run_worker(
+            lambda: (cluster_arn, aws.prefetch_cluster_hierarchy(cluster_arn)),
+            name="prefetch_hierarchy",
+            thread=True
+        )
+
+    def _store_prefetched_hierarchy(self, cluster_arn: str, result: dict) -> None:
+        """Cache tasks and containers prefetched in the background, keeping fresher entries"""
+        self._prefetched_clusters.add(cluster_arn)
+        for service_arn, tasks in result.get('tasks', {}).items():
+            self.cached_tasks.setdefault((cluster_arn, service_arn), tasks)
+        for task_arn, entry in result.get('containers', {}).items():
+            self.cached_containers.setdefault(task_arn, entry)
+
     def _render_service_view(self) -> None:
         """Render service selection view"""
         self._set_status(f"Cluster: {self.selected_cluster['name']}")
-        search = self.query_one("#search", CustomInput)
+        search = self._search_input
         search.value = ""
         search.placeholder = "Type to filter services..."
         self._render_list_view(
             f"Select Service ({self.selected_cluster['name']})",
             self.services,
-            extract_name_from_arn
+            extract_name_from_arn,
+            cache_key=("service", self.selected_cluster['arn'])
         )
         search.focus()
 
@@ -1095,21 +1400,22 @@ class ECSConnectApp(App):
         cluster_arn = self.selected_cluster['arn']
         tasks = self.aws.list_tasks(cluster_arn, self.selected_service)
         if tasks and len(tasks) > 1:
-            tasks = self.aws.enrich_tasks_with_instance_info(cluster_arn, tasks)
+            tasks = self.aws.enrich_tasks_with_instance_info(cluster_arn, tasks, check_ssm=True)
         return tasks
 
     def _render_task_view(self) -> None:
         """Render task selection view"""
-        service_name = extract_name_from_arn(self.selected_service)
+        service_name = self._selected_service_name
         self._set_status(f"Service: {service_name}")
-        search = self.query_one("#search", CustomInput)
+        search = self._search_input
         search.value = ""
         search.placeholder = "Type to filter tasks..."
 
         self._render_list_view(
             f"Select Task ({service_name})",
             self.tasks,
-            self._display_task
+            self._display_task,
+            cache_key=("task", self.selected_cluster['arn'], self.selected_service)
         )
         search.focus()
 
@@ -1125,8 +1431,6 @@ class ECSConnectApp(App):
             parts.append("                   ") # Placeholder for alignment
 
         # 2. IP / Instance
-        instance_ip = t.get('_instanceId', '').replace('i-', '') # Shorten instance ID for display if needed or keep full
-        # Actually user wants IP then Instance ID
         # The enrichment puts _instanceId and _instanceIp
         real_instance_id = t.get('_instanceId', '-')
         real_instance_ip = t.get('_instanceIp', '-')
@@ -1167,7 +1471,7 @@ class ECSConnectApp(App):
         """Show task menu or skip to container menu if only one container"""
         self._set_status(f"Task: {extract_name_from_arn(self.selected_task['taskArn'])}")
 
-        search = self.query_one("#search", CustomInput)
+        search = self._search_input
         search.value = ""
         search.placeholder = ""
 
@@ -1211,7 +1515,7 @@ class ECSConnectApp(App):
     def _update_path_status(self) -> None:
         """Update status bar with full path and task info"""
         cluster_name = self.selected_cluster.get('name', '-') if self.selected_cluster else '-'
-        service_name = extract_name_from_arn(self.selected_service) if self.selected_service else '-'
+        service_name = self._selected_service_name if self.selected_service else '-'
         container_name = self.selected_container.get('name', '') if self.selected_container else ''
         task = self.selected_task
         if task:
@@ -1245,8 +1549,6 @@ class ECSConnectApp(App):
         # Show path and task info in status bar
         self._update_path_status()
 
-        scroll = self.query_one("#scroll-area", VerticalScroll)
-
         # Build container list from task
         container_items = []
         for c in self.containers:
@@ -1259,29 +1561,11 @@ class ECSConnectApp(App):
             ("task_logs", "live logs (all containers)"),
         ]
 
-        # Horizontal container for two sections
-        row = Horizontal(classes="action-row")
-        scroll.mount(row)
-
-        # Containers section (left)
-        containers_box = RegionBox("Containers", "containers")
-        containers_box.border_title = " Containers "
-        row.mount(containers_box)
-
-        containers_options = OptionList(id="list-containers")
-        containers_box.mount(containers_options)
-        for key, label in self._task_menu_containers:
-            containers_options.add_option(Option(label))
-
-        # Logs section (right)
-        logs_box = RegionBox("Logs", "logs")
-        logs_box.border_title = " Logs "
-        row.mount(logs_box)
-
-        logs_options = OptionList(id="list-logs")
-        logs_box.mount(logs_options)
-        for key, label in self._task_menu_logs:
-            logs_options.add_option(Option(label))
+        # Two sections side by side
+        self._mount_menu_sections([
+            ("containers", "Containers", self._task_menu_containers),
+            ("logs", "Logs", self._task_menu_logs),
+        ])
 
         # Track current section and index
         self._menu_section = "containers"
@@ -1290,6 +1574,17 @@ class ECSConnectApp(App):
 
         self.call_after_refresh(self._update_menu_highlight)
 
+    def _mount_menu_sections(self, sections: List[tuple]) -> None:
+        """Build (section, title, items) boxes off-screen and mount them in one row"""
+        boxes = []
+        for section, title, items in sections:
+            option_list = OptionList(*[Option(label) for _, label in items], id=f"list-{section}")
+            box = RegionBox(title, section, option_list)
+            box.border_title = f" {title} "
+            boxes.append(box)
+            self._menu_lists[section] = option_list
+        self._scroll_area.mount(Horizontal(*boxes, classes="action-row"))
+
     def _go_to_container(self) -> None:
         """Go to container selection"""
         self.step = "container"
@@ -1335,8 +1630,8 @@ class ECSConnectApp(App):
         if not instance_id:
             return {'error': 'no_instance'}
 
-        ssm_ok = self.aws.verify_ssm_access(instance_id)
-        if not ssm_ok:
+        # verify_ssm_access caches results for SSM_CACHE_TTL seconds
+        if not self.aws.verify_ssm_access(instance_id):
             return {'error': 'no_ssm', 'instance_id': instance_id}
 
         containers = self.aws.get_task_containers(self.selected_task, exclude_agent=True)
@@ -1348,14 +1643,14 @@ class ECSConnectApp(App):
     def _render_container_view(self) -> None:
         """Render container selection view"""
         self._set_status(f"Instance: {self._instance_id}")
-        search = self.query_one("#search", CustomInput)
+        search = self._search_input
         search.value = ""
         search.placeholder = ""
 
         self._render_list_view(
             "Select Container",
             self.containers,
-            lambda c: f"{c['name']} ({c.get('lastStatus', 'unknown')})"
+            _display_container
         )
         search.focus()
 
@@ -1371,7 +1666,7 @@ class ECSConnectApp(App):
         self._instance_id = instance_id
         self._set_status(f"Instance: {instance_id}")
 
-        search = self.query_one("#search", CustomInput)
+        search = self._search_input
         search.value = ""
         search.placeholder = ""
 
@@ -1389,8 +1684,6 @@ class ECSConnectApp(App):
         # Show path and task info in status bar
         self._update_path_status()
 
-        scroll = self.query_one("#scroll-area", VerticalScroll)
-
         # All available items (stored for filtering)
         self._all_ssh_items = [
             ("container", "container"),
@@ -1408,43 +1701,14 @@ class ECSConnectApp(App):
         self.ssh_items = self._all_ssh_items[:]
         self.logs_items = self._all_logs_items[:]
         self.config_items = self._all_config_items[:]
+        self._confirm_filter = ""
 
-        # Horizontal container for three sections
-        row = Horizontal(classes="action-row")
-        scroll.mount(row)
-
-        # SSH section (left)
-        ssh_box = RegionBox("SSH", "ssh")
-        ssh_box.border_title = " SSH "
-        row.mount(ssh_box)
-
-        ssh_options = OptionList(id="list-ssh")
-        ssh_box.mount(ssh_options)
-
-        for key, label in self.ssh_items:
-            ssh_options.add_option(Option(label))
-
-        # Logs section (middle)
-        logs_box = RegionBox("Logs", "logs")
-        logs_box.border_title = " Logs "
-        row.mount(logs_box)
-
-        logs_options = OptionList(id="list-logs")
-        logs_box.mount(logs_options)
-
-        for key, label in self.logs_items:
-            logs_options.add_option(Option(label))
-
-        # Configuration section (right)
-        config_box = RegionBox("Configuration", "config")
-        config_box.border_title = " Configuration "
-        row.mount(config_box)
-
-        config_options = OptionList(id="list-config")
-        config_box.mount(config_options)
-
-        for key, label in self.config_items:
-            config_options.add_option(Option(label))
+        # Three sections side by side
+        self._mount_menu_sections([
+            ("ssh", "SSH", self.ssh_items),
+            ("logs", "Logs", self.logs_items),
+            ("config", "Configuration", self.config_items),
+        ])
 
         # Track current section and index (using same pattern as task_menu)
         self._menu_section = "ssh"
@@ -1456,6 +1720,10 @@ class ECSConnectApp(App):
     def _filter_confirm_view(self, filter_text: str) -> None:
         """Filter items in confirm view without re-rendering"""
         filter_lower = filter_text.lower()
+        # Clearing the field on entering the view must not rebuild the fresh lists
+        if filter_lower == self._confirm_filter:
+            return
+        self._confirm_filter = filter_lower
 
         # Filter items
         self.ssh_items = [
@@ -1471,32 +1739,13 @@ class ECSConnectApp(App):
             if not filter_text or filter_lower in item[1].lower()
         ]
 
-        # Update SSH OptionList
-        try:
-            ssh_options = self.query_one("#list-ssh", OptionList)
-            ssh_options.clear_options()
-            for key, label in self.ssh_items:
-                ssh_options.add_option(Option(label))
-        except Exception:
-            pass
-
-        # Update Logs OptionList
-        try:
-            logs_options = self.query_one("#list-logs", OptionList)
-            logs_options.clear_options()
-            for key, label in self.logs_items:
-                logs_options.add_option(Option(label))
-        except Exception:
-            pass
-
-        # Update Config OptionList
-        try:
-            config_options = self.query_one("#list-config", OptionList)
-            config_options.clear_options()
-            for key, label in self.config_items:
-                config_options.add_option(Option(label))
-        except Exception:
-            pass
+        # Update the section OptionLists
+        for section, items in (("ssh", self.ssh_items), ("logs", self.logs_items),
+                               ("config", self.config_items)):
+            option_list = self._menu_lists.get(section)
+            if option_list is not None:
+                option_list.clear_options()
+                option_list.add_options([Option(label) for _, label in items])
 
         # Reset selection to first available item
         if self.ssh_items:
@@ -1516,28 +1765,17 @@ class ECSConnectApp(App):
 
     def _update_menu_highlight(self) -> None:
         """Update visual highlight for multi-section menus (task_menu and confirm)"""
-        # Get sections to update based on current step
-        if self.step == "task_menu":
-            sections = ["containers", "logs"]
-        elif self.step == "confirm":
-            sections = ["ssh", "logs", "config"]
-        else:
+        if self.step not in ("task_menu", "confirm"):
             return
 
         # Clear all highlights
-        for section in sections:
-            try:
-                option_list = self.query_one(f"#list-{section}", OptionList)
-                option_list.highlighted = None
-            except Exception:
-                pass
+        for option_list in self._menu_lists.values():
+            option_list.highlighted = None
 
         # Set highlight on current section/item
-        try:
-            option_list = self.query_one(f"#list-{self._menu_section}", OptionList)
+        option_list = self._menu_lists.get(self._menu_section)
+        if option_list is not None:
             option_list.highlighted = self._menu_idx
-        except Exception:
-            pass
 
     # ==================== SELECTION HANDLING ====================
 
@@ -1606,25 +1844,15 @@ class ECSConnectApp(App):
         self.step = "time_select"
         self._set_status("Select time range")
 
-        search = self.query_one("#search", CustomInput)
+        search = self._search_input
         search.value = ""
         search.placeholder = ""
 
-        time_options = [
-            (5, "Last 5 minutes"),
-            (15, "Last 15 minutes"),
-            (30, "Last 30 minutes"),
-            (60, "Last 1 hour"),
-            (120, "Last 2 hours"),
-            (360, "Last 6 hours"),
-            (720, "Last 12 hours"),
-            (1440, "Last 24 hours"),
-        ]
-
         self._render_list_view(
             "Download logs - Select time range",
-            time_options,
-            lambda x: x[1]
+            TIME_RANGE_OPTIONS,
+            _display_time_option,
+            cache_key=("time_select",)
         )
         search.focus()
 
@@ -1634,20 +1862,21 @@ class ECSConnectApp(App):
             _, _, cluster = self.nav_list[self.nav_index]
             self.selected_cluster = cluster
 
-            # Initialize AWS client
-            self.aws = self.aws_client_factory(
-                region=cluster['region'],
-                profile=self._get_cluster_profile(cluster)
-            )
+            # Initialize AWS client (reused if this region was visited before)
+            self.aws = self._get_aws(cluster)
 
-            # Check if cluster is already cached
+            # Check if cluster is already cached (in memory or from a recent run)
             cluster_arn = cluster['arn']
+            self._load_disk_cached_services(cluster_arn)
             if cluster_arn in self.cached_services:
                 # Already cached, go directly to service view
                 self.services = self.cached_services[cluster_arn]
                 self.step = "service"
                 self._render_service_view()
-            elif get_prefetch_enabled():
+                # Only the service list may be known (background or disk cache)
+                if self._prefetch_enabled and cluster_arn not in self._prefetched_clusters:
+                    self._start_hierarchy_prefetch()
+            elif self._prefetch_enabled:
                 # Prefetch entire cluster hierarchy
                 self._show_loading(f"Loading {cluster['name']}...")
                 self.run_worker(
@@ -1664,7 +1893,8 @@ class ECSConnectApp(App):
         """Handle selection in list views"""
         if self.step == "service":
             self.selected_service = item
-            self._set_status(f"Selected: {extract_name_from_arn(item)}")
+            self._selected_service_name = extract_name_from_arn(item)
+            self._set_status(f"Selected: {self._selected_service_name}")
             self._go_to_task()
 
         elif self.step == "task":
@@ -1678,9 +1908,8 @@ class ECSConnectApp(App):
 
         elif self.step == "container":
             self.selected_container = item
-            cluster_arn = self.selected_cluster['arn']
-            instance_id = self.aws.get_container_instance_id(cluster_arn, self.selected_task)
-            self._go_to_confirm(instance_id)
+            # _go_to_container already resolved the instance for this task
+            self._go_to_confirm(self._instance_id)
 
         elif self.step == "confirm":
             self._handle_confirm_select(item)
@@ -1716,7 +1945,7 @@ class ECSConnectApp(App):
                 self.step = "task_menu"
                 self.refresh_bindings()
                 self._set_status(f"Task: {extract_name_from_arn(self.selected_task['taskArn'])}")
-                search = self.query_one("#search", CustomInput)
+                search = self._search_input
                 search.value = ""
                 search.placeholder = ""
                 self._render_task_menu_view()
@@ -1740,52 +1969,35 @@ class ECSConnectApp(App):
     # ==================== EVENT HANDLERS ====================
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input"""
+        """Handle search input, coalescing bursts of keystrokes"""
+        if self._pending_filter_timer:
+            self._pending_filter_timer.stop()
+            self._pending_filter_timer = None
+
+        value = event.value
+        # Clearing the field, typing the first character and filtering the
+        # small fixed action menu stay instant
+        if len(value) <= 1 or self.step == "confirm":
+            self._apply_filter(value)
+        else:
+            self._pending_filter_timer = self.set_timer(0.04, lambda: self._apply_filter(value))
+
+    def _apply_filter(self, value: str) -> None:
+        """Apply search filter to the current view"""
+        self._pending_filter_timer = None
         if self.step == "cluster":
-            self._render_cluster_view(event.value)
-        elif self.step == "service":
-            self._render_list_view(
-                f"Select Service ({self.selected_cluster['name']})",
-                self.services,
-                extract_name_from_arn,
-                filter_text=event.value
-            )
-        elif self.step == "task":
-            self._render_list_view(
-                f"Select Task ({extract_name_from_arn(self.selected_service)})",
-                self.tasks,
-                self._display_task,
-                filter_text=event.value
-            )
-        elif self.step == "task_menu":
-            # Re-render task menu (no filtering needed but keeps consistency)
-            self._render_task_menu_view()
-        elif self.step == "container":
-            self._render_list_view(
-                "Select Container",
-                self.containers,
-                lambda c: f"{c['name']} ({c.get('lastStatus', 'unknown')})",
-                filter_text=event.value
-            )
-        elif self.step == "time_select":
-            time_options = [
-                (5, "Last 5 minutes"),
-                (15, "Last 15 minutes"),
-                (30, "Last 30 minutes"),
-                (60, "Last 1 hour"),
-                (120, "Last 2 hours"),
-                (360, "Last 6 hours"),
-                (720, "Last 12 hours"),
-                (1440, "Last 24 hours"),
-            ]
-            self._render_list_view(
-                "Download logs - Select time range",
-                time_options,
-                lambda x: x[1],
-                filter_text=event.value
-            )
+            self._filter_cluster_view(value)
+        elif self.step in ("service", "task", "container", "time_select"):
+            self._filter_list_view(value)
         elif self.step == "confirm":
-            self._filter_confirm_view(event.value)
+            self._filter_confirm_view(value)
+        # The task menu has nothing to filter
+
+    def _flush_pending_filter(self) -> None:
+        """Apply a debounced filter now, before acting on the filtered list"""
+        if self._pending_filter_timer:
+            self._pending_filter_timer.stop()
+            self._apply_filter(self._search_input.value)
 
     def on_input_submitted(self, event: CustomInput.Submitted) -> None:
         """Handle enter in search field"""
@@ -1794,46 +2006,23 @@ class ECSConnectApp(App):
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle mouse click on option"""
         if self.step == "cluster":
-            # Find clicked cluster by matching option list ID
-            option_list = event.option_list
-            for i, (list_id, idx, cluster) in enumerate(self.nav_list):
-                if option_list.id == list_id and idx == event.option_index:
-                    self.nav_index = i
-                    self._handle_cluster_select()
-                    return
-        elif self.step == "task_menu":
-            # Find clicked action in task menu
-            option_list = event.option_list
-            section_items = {
-                "containers": self._task_menu_containers,
-                "logs": self._task_menu_logs,
-            }
-            for section, items in section_items.items():
-                if option_list.id == f"list-{section}":
-                    self._menu_section = section
-                    self._menu_idx = event.option_index
-                    if 0 <= event.option_index < len(items):
-                        self._handle_task_menu_select(items[event.option_index])
-                    return
-        elif self.step == "confirm":
-            # Find clicked action in confirm view
-            option_list = event.option_list
-            section_items = {
-                "ssh": self.ssh_items,
-                "logs": self.logs_items,
-                "config": self.config_items,
-            }
-            for section, items in section_items.items():
-                if option_list.id == f"list-{section}":
+            # Find clicked cluster by option list ID and index
+            nav_index = self._nav_by_list_idx.get((event.option_list.id, event.option_index))
+            if nav_index is not None:
+                self.nav_index = nav_index
+                self._handle_cluster_select()
+        elif self.step in ("task_menu", "confirm"):
+            # Find clicked action by the section it was clicked in
+            for section, option_list in self._menu_lists.items():
+                if option_list is event.option_list:
                     self._menu_section = section
                     self._menu_idx = event.option_index
-                    if 0 <= event.option_index < len(items):
-                        self._handle_confirm_select(items[event.option_index])
+                    self._select_menu_item()
                     return
         else:
             # List view
-            if event.option_index in self.index_to_item:
-                item = self.index_to_item[event.option_index]
+            item = self.index_to_item.get(event.option_index)
+            if item is not None:
                 self._handle_list_select(item)
 
     def _get_current_menu_items(self) -> list:
@@ -1852,27 +2041,27 @@ class ECSConnectApp(App):
                 return self.config_items
         return []
 
+    def _select_menu_item(self) -> None:
+        """Run the action at _menu_idx in the current task menu or confirm section"""
+        items = self._get_current_menu_items()
+        if 0 <= self._menu_idx < len(items):
+            if self.step == "task_menu":
+                self._handle_task_menu_select(items[self._menu_idx])
+            else:
+                self._handle_confirm_select(items[self._menu_idx])
+
     def action_select_current(self) -> None:
         """Select currently highlighted item"""
+        self._flush_pending_filter()
         if self.step == "cluster":
             self._handle_cluster_select()
-        elif self.step == "task_menu":
-            items = self._get_current_menu_items()
-            if 0 <= self._menu_idx < len(items):
-                self._handle_task_menu_select(items[self._menu_idx])
-        elif self.step == "confirm":
-            items = self._get_current_menu_items()
-            if 0 <= self._menu_idx < len(items):
-                self._handle_confirm_select(items[self._menu_idx])
+        elif self.step in ("task_menu", "confirm"):
+            self._select_menu_item()
         else:
-            try:
-                option_list = self.query_one(f"#{self._current_options_id}", OptionList)
-                highlighted = option_list.highlighted
-                if highlighted is not None and highlighted in self.index_to_item:
-                    item = self.index_to_item[highlighted]
+            if self._options_list.display:
+                item = self.index_to_item.get(self._options_list.highlighted)
+                if item is not None:
                     self._handle_list_select(item)
-            except Exception:
-                pass
 
     def action_go_back(self) -> None:
         """Go back to previous step"""
@@ -1880,51 +2069,36 @@ class ECSConnectApp(App):
 
     def action_nav_up(self) -> None:
         """Navigate up"""
+        # Move within the filtered list, not the one the debounce is about to replace
+        self._flush_pending_filter()
         if self.step == "cluster":
             if self.nav_list:
-                if self.nav_index > 0:
-                    self.nav_index -= 1
-                else:
-                    self.nav_index = len(self.nav_list) - 1
+                self.nav_index = (self.nav_index - 1) % len(self.nav_list)
                 self._update_cluster_highlight()
         elif self.step in ("task_menu", "confirm"):
-            # Stay within current section
+            # Stay within current section, wrapping around
             items = self._get_current_menu_items()
-            if self._menu_idx > 0:
-                self._menu_idx -= 1
-            else:
-                self._menu_idx = len(items) - 1 if items else 0
+            self._menu_idx = (self._menu_idx - 1) % len(items) if items else 0
             self._update_menu_highlight()
         else:
-            try:
-                option_list = self.query_one(f"#{self._current_options_id}", OptionList)
-                option_list.action_cursor_up()
-            except Exception:
-                pass
+            if self._options_list.display:
+                self._options_list.action_cursor_up()
 
     def action_nav_down(self) -> None:
         """Navigate down"""
+        self._flush_pending_filter()
         if self.step == "cluster":
             if self.nav_list:
-                if self.nav_index < len(self.nav_list) - 1:
-                    self.nav_index += 1
-                else:
-                    self.nav_index = 0
+                self.nav_index = (self.nav_index + 1) % len(self.nav_list)
                 self._update_cluster_highlight()
         elif self.step in ("task_menu", "confirm"):
-            # Stay within current section
+            # Stay within current section, wrapping around
             items = self._get_current_menu_items()
-            if self._menu_idx < len(items) - 1:
-                self._menu_idx += 1
-            else:
-                self._menu_idx = 0
+            self._menu_idx = (self._menu_idx + 1) % len(items) if items else 0
             self._update_menu_highlight()
         else:
-            try:
-                option_list = self.query_one(f"#{self._current_options_id}", OptionList)
-                option_list.action_cursor_down()
-            except Exception:
-                pass
+            if self._options_list.display:
+                self._options_list.action_cursor_down()
 
     def action_noop(self) -> None:
         """Do nothing - absorb tab key"""
@@ -1940,15 +2114,28 @@ class ECSConnectApp(App):
             return
 
         worker_name = event.worker.name
-        result = event.worker.result
-        self._hide_loading()
+        if worker_name == "prefetch_services":
+            # Background work, nothing is waiting on it
+            return
+        if worker_name == "prefetch_hierarchy":
+            self._store_prefetched_hierarchy(*event.worker.result)
+            return
 
+        # Hide the overlay and render the next view in a single repaint
+        with self.batch_update():
+            self._hide_loading()
+            self._handle_worker_result(worker_name, event.worker.result)
+
+    def _handle_worker_result(self, worker_name: str, result: Any) -> None:
+        """Apply a finished worker's result to the cache and views"""
         if worker_name == "prefetch_cluster":
             cluster_arn = self.selected_cluster['arn']
 
             # Cache services
             self.services = result.get('services', [])
             self.cached_services[cluster_arn] = self.services
+            save_cached_services(self._get_cluster_profile(), cluster_arn, self.services)
+            self._prefetched_clusters.add(cluster_arn)
 
             # Cache tasks for each service
             for service_arn, tasks in result.get('tasks', {}).items():
@@ -1968,6 +2155,7 @@ class ECSConnectApp(App):
             cluster_arn = self.selected_cluster['arn']
             self.services = result
             self.cached_services[cluster_arn] = result
+            save_cached_services(self._get_cluster_profile(), cluster_arn, result)
             self.refresh_bindings()
             self._render_service_view()
 
@@ -2071,11 +2259,7 @@ class ECSConnectApp(App):
 
     def _is_help_visible(self) -> bool:
         """Check if help overlay is visible"""
-        try:
-            self.query_one("#help-overlay")
-            return True
-        except Exception:
-            return False
+        return self._help_overlay.display
 
     # ==================== REDEPLOY SERVICES ====================
 
@@ -2092,7 +2276,7 @@ class ECSConnectApp(App):
         if self.step == "service" and self.services:
             self.push_screen(RedeployServicesModal(self.services), self._batch_redeploy_services)
         elif self.step in ("task_menu", "confirm") and self.selected_service:
-            service_name = extract_name_from_arn(self.selected_service)
+            service_name = self._selected_service_name
             self.push_screen(
                 ConfirmModal(f"Force redeploy service '{service_name}'?"),
                 lambda should_redeploy: self._batch_redeploy_services([self.selected_service]) if should_redeploy else None,
@@ -2134,11 +2318,8 @@ class ECSConnectApp(App):
 
     def _update_loading_message(self, message: str) -> None:
         """Update loading message text"""
-        try:
-            box = self.query_one("#loading-box Static", Static)
-            box.update(message)
-        except Exception:
-            pass
+        if self._loading_message is not None:
+            self._loading_message.update(message)
 
     def on_key(self, event) -> None:
         """Handle key presses"""
@@ -2218,8 +2399,8 @@ class ECSConnectApp(App):
 class RegionBox(Container):
     """A bordered container for a region's clusters"""
 
-    def __init__(self, region_name: str, region_id: str):
-        super().__init__()
+    def __init__(self, region_name: str, region_id: str, *children):
+        super().__init__(*children)
         self.region_name = region_name
         self.region_id = region_id
 
@@ -2228,19 +2409,21 @@ class RegionBox(Container):
 
 def run_ecs_connect(clusters: List[dict], aws_client_class, profile: Optional[str] = None,
                     initial_cluster: Optional[dict] = None,
-                    resume_context: Optional[dict] = None) -> Optional[dict]:
+                    resume_context: Optional[dict] = None,
+                    clusters_at: Optional[float] = None) -> Optional[dict]:
     """
     Run the EZS interactive UI.
     Returns result dict with connection info, or None if cancelled.
 
     resume_context: dict with keys to resume from Select Action:
         - cluster, service, task, container, instance_id
+    clusters_at: when the cluster list was fetched, shown as its age in the cluster view
     """
     if not clusters:
         print("No clusters found")
         return None
 
-    app = ECSConnectApp(clusters, aws_client_class, profile, initial_cluster, resume_context)
+    app = ECSConnectApp(clusters, aws_client_class, profile, initial_cluster, resume_context, clusters_at)
     app.run()
 
     if app.cancelled:
@@ -2252,12 +2435,13 @@ def run_ecs_connect(clusters: List[dict], aws_client_class, profile: Optional[st
         app.result['service'] = app.selected_service
         app.result['task'] = app.selected_task
         app.result['container'] = app.selected_container
-        app.result['instance_id'] = getattr(app, '_instance_id', None)
+        app.result['instance_id'] = app._instance_id
         # Resolve profile from cluster (for multi-account)
         app.result['profile'] = app._get_cluster_profile()
         # Include ALL cached data for faster resume
         app.result['cached_services'] = app.cached_services
         app.result['cached_tasks'] = app.cached_tasks
         app.result['cached_containers'] = app.cached_containers
+        app.result['prefetched_clusters'] = app._prefetched_clusters
 
     return app.result
@@ -4,6 +4,7 @@ import re
 import time
 import heapq
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Generator, Dict, Any
 from textual.app import App, ComposeResult
 from textual.widgets import Input, OptionList, Static, LoadingIndicator, Button, Label, RichLog
@@ -38,6 +39,12 @@ def parse_log_level(message: str) -> str:
     return "INFO"
 
 
+@lru_cache(maxsize=1024)
+def format_log_time(seconds: int, fmt: str = '%H:%M:%S') -> str:
+    """Format an epoch second as local time. Cached, since log lines bunch up on the same seconds."""
+    return datetime.fromtimestamp(seconds).strftime(fmt)
+
+
 class LiveLogsApp(App):
     """Live logs viewer with filtering by level and container"""
 
@@ -298,10 +305,10 @@ class LiveLogsApp(App):
                     # Sort by timestamp
                     all_events.sort(key=lambda x: x.get('timestamp', 0))
 
-                    for event in all_events:
-                        if not self._streaming:
-                            return
-                        self.call_from_thread(self._add_log_event, event)
+                    if not self._streaming:
+                        return
+                    # Hand the whole batch to the UI thread in one round-trip
+                    self.call_from_thread(self._add_log_events, all_events)
 
                 if not any_data:
                     # Sleep if no new data across all streams
@@ -313,25 +320,26 @@ class LiveLogsApp(App):
             if self._streaming:
                 self.call_from_thread(self._show_error, str(e))
 
-    def _add_log_event(self, event: dict) -> None:
-        """Add a log event to the buffer and display if matches filter"""
-        timestamp = event.get('timestamp', 0)
-        message = event.get('message', '')
-        container = event.get('container', '')
-        level = parse_log_level(message)
-
-        log_entry = {
-            'timestamp': timestamp,
-            'message': message,
-            'level': level,
-            'container': container
-        }
-        self._log_buffer.append(log_entry)
-        self._total_count += 1
-
-        if self._matches_filter(level, container):
-            self._display_log(log_entry)
-            self._shown_count += 1
+    def _add_log_events(self, events: List[dict]) -> None:
+        """Add log events to the buffer and display those matching the filter"""
+        for event in events:
+            timestamp = event.get('timestamp', 0)
+            message = event.get('message', '')
+            container = event.get('container', '')
+            level = parse_log_level(message)
+
+            log_entry = {
+                'timestamp': timestamp,
+                'message': message,
+                'level': level,
+                'container': container
+            }
+            self._log_buffer.append(log_entry)
+            self._total_count += 1
+
+            if self._matches_filter(level, container):
+                self._display_log(log_entry)
+                self._shown_count += 1
 
         self._update_info()
 
@@ -362,8 +370,7 @@ class LiveLogsApp(App):
         level = log_entry['level']
         container = log_entry['container']
 
-        dt = datetime.fromtimestamp(timestamp / 1000)
-        time_str = dt.strftime('%H:%M:%S')
+        time_str = format_log_time(timestamp // 1000)
 
         # Color based on level
         level_colors = {
@@ -7,12 +7,10 @@ import sys
 import os
 import time
 import argparse
+import threading
 from datetime import datetime
 from pathlib import Path
 from rich.console import Console
-from rich.panel import Panel
-from rich.align import Align
-from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.widgets import Static, LoadingIndicator
 from textual.containers import Container
@@ -20,11 +18,8 @@ from textual.worker import WorkerState
 from .config import REGIONS, reload_regions, reload_accounts
 from .config_manager import config_exists, get_configured_accounts
 from .aws_client import AWSClient
+from .cache import CLUSTERS_CACHE_TTL, load_cached_clusters, save_cached_clusters
 from .interactive import run_ecs_connect
-from .setup_wizard import run_setup_wizard
-from .live_logs import run_live_logs, run_live_logs_with_loading, run_task_logs_with_loading
-from .download_logs import run_download_logs, run_download_logs_with_loading
-from .env_viewer import run_env_viewer
 from .ssm_session import (
     check_session_manager_plugin,
     start_ssh_session,
@@ -33,6 +28,46 @@ from .ssm_session import (
 
 console = Console()
 
+# Refresh the cluster list in the background once it is this close to expiring
+CLUSTERS_REFRESH_AHEAD = 60
+
+
+def fetch_clusters(regions: dict = None, profile: str = None, accounts: list = None,
+                   failed: set = None) -> list:
+    """List clusters for the configured accounts, or for regions under one profile.
+
+    (profile, region) pairs whose listing failed are added to `failed` when given.
+    """
+    if accounts:
+        return AWSClient.list_all_clusters_multi(accounts, failed=failed)
+    return AWSClient.list_all_clusters(regions, profile=profile, failed=failed)
+
+
+def refresh_clusters_in_background(cache_source: dict, regions: dict = None,
+                                   profile: str = None, accounts: list = None) -> dict:
+    """Re-list clusters on a daemon thread.
+
+    The returned dict gets 'done' (and 'clusters' on success) once the fetch finishes.
+    A refresh where any region failed is dropped, so a transient error cannot hide
+    that region's clusters until the next refresh.
+    """
+    state = {}
+
+    def run():
+        try:
+            failed = set()
+            clusters = fetch_clusters(regions, profile, accounts, failed=failed)
+            if clusters and not failed:
+                save_cached_clusters(cache_source, clusters)
+                state['clusters'] = clusters
+        except Exception:
+            pass
+        finally:
+            state['done'] = True
+
+    threading.Thread(target=run, daemon=True).start()
+    return state
+
 
 class ClusterLoadingApp(App):
     """Loading screen while fetching clusters"""
@@ -72,6 +107,7 @@ class ClusterLoadingApp(App):
         self.profile = profile
         self.accounts = accounts
         self.clusters = None
+        self.failed_regions = set()  # (profile, region) pairs whose listing failed
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -84,9 +120,7 @@ class ClusterLoadingApp(App):
         self.run_worker(self._fetch_clusters, name="fetch_clusters", thread=True)
 
     def _fetch_clusters(self) -> list:
-        if self.accounts:
-            return AWSClient.list_all_clusters_multi(self.accounts)
-        return AWSClient.list_all_clusters(self.regions, profile=self.profile)
+        return fetch_clusters(self.regions, self.profile, self.accounts, failed=self.failed_regions)
 
     def on_worker_state_changed(self, event) -> None:
         if event.worker.name != "fetch_clusters":
@@ -99,13 +133,27 @@ class ClusterLoadingApp(App):
             self.exit(result="error")
 
 
+# AWS clients reused across the session loop, keyed by (region, profile)
+_aws_clients = {}
+
+
+def get_aws_client(region: str, profile: str = None) -> AWSClient:
+    """Get an AWSClient for region and profile, creating it once per session"""
+    key = (region, profile)
+    aws = _aws_clients.get(key)
+    if aws is None:
+        aws = _aws_clients[key] = AWSClient(region=region, profile=profile)
+    return aws
+
+
 def stream_live_logs(result: dict, profile: str = None):
     """Stream live logs from CloudWatch with TUI"""
+    from .live_logs import run_live_logs_with_loading
     task = result['task']
     container = result['container']
     region = result['region']
 
-    aws = AWSClient(region=region, profile=profile)
+    aws = get_aws_client(region, profile)
     container_name = container.get('name') if container else None
 
     if not container_name:
@@ -123,10 +171,11 @@ def stream_live_logs(result: dict, profile: str = None):
 
 def stream_task_logs(result: dict, profile: str = None):
     """Stream live logs for ALL containers in a task"""
+    from .live_logs import run_task_logs_with_loading
     task = result['task']
     region = result['region']
 
-    aws = AWSClient(region=region, profile=profile)
+    aws = get_aws_client(region, profile)
     task_id = task.get('taskArn', '').split('/')[-1]
 
     # Run with loading screen
@@ -154,7 +203,7 @@ def view_env_vars(result: dict, profile: str = None) -> dict:
     if not container_name:
         return {'was_redeployed': False}
 
-    aws = AWSClient(region=region, profile=profile)
+    aws = get_aws_client(region, profile)
 
     return run_env_viewer_with_loading(
         aws_client=aws,
@@ -183,7 +232,7 @@ def view_task_env_vars(result: dict, profile: str = None) -> dict:
 
     # Use first container
     container_name = containers[0].get('name')
-    aws = AWSClient(region=region, profile=profile)
+    aws = get_aws_client(region, profile)
 
     return run_env_viewer_with_loading(
         aws_client=aws,
@@ -196,12 +245,13 @@ def view_task_env_vars(result: dict, profile: str = None) -> dict:
 
 def download_logs(result: dict, profile: str = None):
     """Download logs from CloudWatch with TUI"""
+    from .download_logs import run_download_logs_with_loading
     task = result['task']
     container = result['container']
     region = result['region']
     minutes = result.get('minutes', 60)
 
-    aws = AWSClient(region=region, profile=profile)
+    aws = get_aws_client(region, profile)
     container_name = container.get('name') if container else None
 
     if not container_name:
@@ -221,6 +271,7 @@ def main():
     parser = argparse.ArgumentParser(description="EZS - ECS Container Access Tool")
     parser.add_argument('--profile', type=str, help='AWS profile to use (overrides config accounts)')
     parser.add_argument('--configure', action='store_true', help='Configure AWS regions for ECS discovery')
+    parser.add_argument('--refresh', action='store_true', help='Ignore the cached cluster list and fetch it from AWS')
     args = parser.parse_args()
 
     # Check prerequisites
@@ -229,6 +280,7 @@ def main():
 
     # Check if first run or --configure flag
     if args.configure or not config_exists():
+        from .setup_wizard import run_setup_wizard
         if not config_exists():
             console.print("[cyan]First run detected. Starting setup wizard...[/cyan]")
 
@@ -243,32 +295,55 @@ def main():
         console.print(f"[green]Configuration saved. {len(result)} regions configured.[/green]")
 
     # Determine how to fetch clusters
+    regions = None
+    accounts = None
     if args.profile:
         # Explicit --profile: single account mode (legacy)
         regions = REGIONS
         loader = ClusterLoadingApp(regions=regions, profile=args.profile)
+        cache_source = {'profile': args.profile, 'regions': list(regions)}
     else:
         # Multi-account mode from config
         accounts = get_configured_accounts()
         loader = ClusterLoadingApp(accounts=accounts)
+        cache_source = {'accounts': accounts}
 
-    result = loader.run()
+    # Reuse the cluster list from a recent run unless asked to refresh
+    clusters, clusters_at = (None, None) if args.refresh else load_cached_clusters(cache_source)
+    refresh = None
+    if not clusters:
+        result = loader.run()
 
-    if result != "success" or not loader.clusters:
-        console.print("[red]No ECS clusters found in any region.[/red]")
-        sys.exit(1)
+        if result != "success" or not loader.clusters:
+            console.print("[red]No ECS clusters found in any region.[/red]")
+            sys.exit(1)
 
-    clusters = loader.clusters
+        clusters = loader.clusters
+        clusters_at = time.time()
+        # Don't cache a list missing the clusters of a region that failed
+        if not loader.failed_regions:
+            save_cached_clusters(cache_source, clusters)
 
     # Run the interactive UI (stays in Textual until SSH session)
     resume_context = None
 
     while True:
+        # Pick up a finished background refresh, and start another once the
+        # list is about to expire (e.g. after a long SSH session)
+        if refresh is not None and refresh.get('done'):
+            if refresh.get('clusters'):
+                clusters = refresh['clusters']
+                clusters_at = time.time()
+            refresh = None
+        if refresh is None and time.time() - clusters_at > CLUSTERS_CACHE_TTL - CLUSTERS_REFRESH_AHEAD:
+            refresh = refresh_clusters_in_background(cache_source, regions, args.profile, accounts)
+
         result = run_ecs_connect(
             clusters=clusters,
-            aws_client_class=AWSClient,
+            aws_client_class=get_aws_client,
             profile=args.profile,
-            resume_context=resume_context
+            resume_context=resume_context,
+            clusters_at=clusters_at
         )
 
         if result is None:
@@ -286,6 +361,7 @@ def main():
             'cached_services': result.get('cached_services', {}),
             'cached_tasks': result.get('cached_tasks', {}),
             'cached_containers': result.get('cached_containers', {}),
+            'prefetched_clusters': result.get('prefetched_clusters', set()),
         }
 
         # Track redeployed services for cache invalidation
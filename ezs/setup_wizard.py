@@ -186,6 +186,7 @@ class SetupWizardApp(App):
         self._current_index = 0
         self._render_id = 0
         self._method_index = 0  # 0 = auto-detect, 1 = manual
+        self._options_list: Optional[OptionList] = None  # region list while in manual_select
 
     def compose(self) -> ComposeResult:
         yield Static("EZS Setup", id="title")
@@ -208,6 +209,7 @@ class SetupWizardApp(App):
         for child in list(scroll.children):
             child.remove()
         self._render_id += 1
+        self._options_list = None
 
     def _show_loading(self, message: str = "Loading...") -> None:
         self._hide_loading()
@@ -315,9 +317,11 @@ class SetupWizardApp(App):
         self._options_id = f"options-{self._render_id}"
         option_list = OptionList(id=self._options_id)
         scroll.mount(option_list)
+        self._options_list = option_list
 
         filter_lower = filter_text.lower() if filter_text else ""
         self._filtered_regions = []
+        options = []
 
         for region in self.all_regions:
             display_name = get_region_display_name(region)
@@ -328,9 +332,11 @@ class SetupWizardApp(App):
 
             # Show checkbox state - more visible icons
             checkbox = "[■]" if region in self.selected_regions else "[ ]"
-            option_list.add_option(Option(f"{checkbox} {label}"))
+            options.append(Option(f"{checkbox} {label}"))
             self._filtered_regions.append(region)
 
+        option_list.add_options(options)
+
         if self._filtered_regions:
             option_list.highlighted = 0
             self._current_index = 0
@@ -349,9 +355,8 @@ class SetupWizardApp(App):
 
     def _update_region_display(self) -> None:
         """Update checkbox display for current selection"""
-        try:
-            option_list = self.query_one(f"#{self._options_id}", OptionList)
-        except Exception:
+        option_list = self._options_list
+        if option_list is None:
             return
 
         # Remember current position
@@ -360,11 +365,13 @@ class SetupWizardApp(App):
         # Clear and repopulate
         option_list.clear_options()
 
+        options = []
         for region in self._filtered_regions:
             display_name = get_region_display_name(region)
             label = f"{display_name} ({region})"
             checkbox = "[■]" if region in self.selected_regions else "[ ]"
-            option_list.add_option(Option(f"{checkbox} {label}"))
+            options.append(Option(f"{checkbox} {label}"))
+        option_list.add_options(options)
 
         # Restore position
         if current_highlighted is not None and current_highlighted < len(self._filtered_regions):
@@ -391,11 +398,9 @@ class SetupWizardApp(App):
 
         # Get index from parameter or from highlighted option
         if index is None:
-            try:
-                option_list = self.query_one(f"#{self._options_id}", OptionList)
-                index = option_list.highlighted
-            except Exception:
+            if self._options_list is None:
                 return
+            index = self._options_list.highlighted
 
         if index is None or index < 0 or index >= len(self._filtered_regions):
             return
@@ -511,23 +516,15 @@ class SetupWizardApp(App):
         """Navigate up"""
         if self.step == "choose_method":
             self._toggle_method()
-        else:
-            try:
-                option_list = self.query_one(f"#{self._options_id}", OptionList)
-                option_list.action_cursor_up()
-            except Exception:
-                pass
+        elif self._options_list is not None:
+            self._options_list.action_cursor_up()
 
     def action_nav_down(self) -> None:
         """Navigate down"""
         if self.step == "choose_method":
             self._toggle_method()
-        else:
-            try:
-                option_list = self.query_one(f"#{self._options_id}", OptionList)
-                option_list.action_cursor_down()
-            except Exception:
-                pass
+        elif self._options_list is not None:
+            self._options_list.action_cursor_down()
 
     def _toggle_method(self) -> None:
         """Toggle between auto-detect and manual"""
@@ -3,6 +3,7 @@
 import subprocess
 import json
 import os
+import shutil
 import sys
 from typing import Optional
 from rich.console import Console
@@ -74,58 +75,6 @@ def reset_terminal():
         pass
 
 
-def get_container_id(instance_id: str, container_name: str, region: str) -> Optional[str]:
-    """Get Docker container ID from EC2 instance via SSM"""
-    try:
-        # Execute docker ps command via SSM (with sudo for permissions)
-        # Use regex anchor for exact match: ^/name$ (docker adds / prefix to names)
-        command = f"sudo docker ps --filter 'name=^/{container_name}$' --format '{{{{.ID}}}}'"
-        
-        result = subprocess.run([
-            'aws', 'ssm', 'send-command',
-            '--instance-ids', instance_id,
-            '--document-name', 'AWS-RunShellScript',
-            '--parameters', f'commands=["{command}"]',
-            '--region', region,
-            '--output', 'json'
-        ], capture_output=True, text=True, timeout=10)
-        
-        if result.returncode != 0:
-            console.print(f"[red]Failed to send SSM command: {result.stderr}[/red]")
-            return None
-        
-        response = json.loads(result.stdout)
-        command_id = response['Command']['CommandId']
-        
-        # Wait and get command output
-        import time
-        time.sleep(2)  # Give command time to execute
-        
-        output_result = subprocess.run([
-            'aws', 'ssm', 'get-command-invocation',
-            '--command-id', command_id,
-            '--instance-id', instance_id,
-            '--region', region,
-            '--output', 'json'
-        ], capture_output=True, text=True, timeout=10)
-        
-        if output_result.returncode != 0:
-            console.print(f"[red]Failed to get command output: {output_result.stderr}[/red]")
-            return None
-        
-        output = json.loads(output_result.stdout)
-        container_id = output.get('StandardOutputContent', '').strip()
-        
-        return container_id if container_id else None
-        
-    except subprocess.TimeoutExpired:
-        console.print("[red]SSM command timed out[/red]")
-        return None
-    except Exception as e:
-        console.print(f"[red]Error getting container ID: {e}[/red]")
-        return None
-
-
 def _build_aws_cmd(base_cmd: list, profile: Optional[str] = None) -> list:
     """Add --profile to AWS CLI command if specified"""
     if profile:
@@ -172,7 +121,7 @@ def start_container_session(instance_id: str, container_id: str, region: str,
             '--target', instance_id,
             '--region', region,
             '--document-name', 'AWS-StartInteractiveCommand',
-            '--parameters', f'{{"command":["{docker_command}"]}}'
+            '--parameters', json.dumps({'command': [docker_command]})
         ], profile)
         subprocess.run(cmd)
     except KeyboardInterrupt:
@@ -187,6 +136,9 @@ def start_container_session(instance_id: str, container_id: str, region: str,
 
 def check_session_manager_plugin() -> bool:
     """Verify that AWS Session Manager plugin is installed"""
+    # A PATH lookup is enough in the common case; only run the plugin if it isn't found
+    if shutil.which('session-manager-plugin'):
+        return True
     try:
         result = subprocess.run(
             ['session-manager-plugin'],
@@ -0,0 +1,36 @@
+"""Tests for the on-disk cache"""
+
+import pytest
+
+from ezs import cache
+
+CLUSTER_ARN = "arn:aws:ecs:eu-west-1:123456789012:cluster/api"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "SERVICES_CACHE_FILE", tmp_path / "services.json")
+    return tmp_path
+
+
+def test_services_round_trip():
+    services = [f"{CLUSTER_ARN}/web"]
+    cache.save_cached_services("prod", CLUSTER_ARN, services)
+    assert cache.load_cached_services("prod", CLUSTER_ARN) == services
+    assert cache.load_cached_services("dev", CLUSTER_ARN) is None
+
+
+def test_empty_service_list_is_not_cached():
+    # list_services returns [] on errors too, so [] must not become a cache hit
+    cache.save_cached_services("prod", CLUSTER_ARN, [])
+    assert cache.load_cached_services("prod", CLUSTER_ARN) is None
+    assert not cache.SERVICES_CACHE_FILE.exists()
+
+
+def test_empty_entry_on_disk_is_a_miss():
+    # Files written before empty lists were skipped
+    cache._write_cache(cache.SERVICES_CACHE_FILE, {
+        cache._services_key("prod", CLUSTER_ARN): {'ts': cache.time.time(), 'services': []}
+    })
+    assert cache.load_cached_services("prod", CLUSTER_ARN) is None
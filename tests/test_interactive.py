@@ -0,0 +1,66 @@
+"""Tests for the interactive cluster picker"""
+
+import asyncio
+
+from textual.widgets import Input
+
+from ezs.interactive import ECSConnectApp
+
+
+def _clusters():
+    regions = [("eu-west-1", "EU West"), ("us-east-1", "US East"), ("ap-south-1", "Asia Pacific")]
+    return [
+        {
+            'name': f"{prefix}-{region}",
+            'arn': f"arn:aws:ecs:{region}:123456789012:cluster/{prefix}-{region}",
+            'region': region,
+            'region_name': region_name,
+        }
+        for region, region_name in regions
+        for prefix in ("api", "workers", "batch")
+    ]
+
+
+def _highlighted_cluster_lists(app):
+    return [
+        option_list for _, option_list in app._cluster_lists.values()
+        if option_list.is_mounted and option_list.highlighted is not None
+    ]
+
+
+def test_only_one_cluster_list_highlighted():
+    async def run():
+        app = ECSConnectApp(_clusters(), aws_client_factory=None)
+        app._prefetch_enabled = False
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert len(_highlighted_cluster_lists(app)) == 1
+
+            # "work" rebuilds each region's list down to one row
+            app._filter_cluster_view("work")
+            await pilot.pause()
+            assert len(_highlighted_cluster_lists(app)) == 1
+
+            # Clearing the filter rebuilds every list again
+            app._filter_cluster_view("")
+            await pilot.pause()
+            assert len(_highlighted_cluster_lists(app)) == 1
+
+    asyncio.run(run())
+
+
+def test_navigation_applies_pending_filter():
+    async def run():
+        app = ECSConnectApp(_clusters(), aws_client_factory=None)
+        app._prefetch_enabled = False
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            # Press "down" while the debounced filter is still pending
+            app._search_input.value = "work"
+            app.on_input_changed(Input.Changed(app._search_input, "work"))
+            assert app._pending_filter_timer is not None
+            app.action_nav_down()
+            assert len(app.nav_list) == 3
+            assert app.nav_list[app.nav_index][2]['name'] == "workers-us-east-1"
+
+    asyncio.run(run())